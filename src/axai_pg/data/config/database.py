@@ -1,8 +1,9 @@
-from typing import Dict, Optional, Callable
+from typing import Dict, Optional, Callable, Type
 from dataclasses import dataclass
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy.orm import Session, sessionmaker, DeclarativeBase
 from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
 from contextlib import contextmanager
 import os
 import time
@@ -33,6 +34,7 @@ class PostgresPoolConfig:
     pool_timeout: int = 30
     pool_recycle: int = 1800
     pool_pre_ping: bool = True
+    poolclass: Type[Pool] = QueuePool
 
 
 @dataclass
@@ -85,6 +87,14 @@ class DatabaseManager:
         if pool_config is None:
             pool_config = PostgresPoolConfig()
 
+        # The engine is synchronous (psycopg2); an asyncio pool would block
+        # worker threads waiting on an event loop that never runs
+        if issubclass(pool_config.poolclass, AsyncAdaptedQueuePool):
+            raise ValueError(
+                f"{pool_config.poolclass.__name__} requires an async engine; "
+                "DatabaseManager uses a synchronous engine"
+            )
+
         # Construct connection URL
         url = (
             f"postgresql://{conn_config.username}:{conn_config.password}"
@@ -94,6 +104,7 @@ class DatabaseManager:
         # Configure engine with retry mechanism
         instance._engine = create_engine(
             url,
+            poolclass=pool_config.poolclass,
             pool_size=pool_config.pool_size,
             max_overflow=pool_config.max_overflow,
             pool_timeout=pool_config.pool_timeout,
@@ -104,6 +115,21 @@ class DatabaseManager:
 
         instance._SessionFactory = sessionmaker(bind=instance._engine)
 
+    @classmethod
+    def use_engine(
+        cls, engine: Engine, session_factory: Optional[sessionmaker] = None
+    ) -> "DatabaseManager":
+        """Bind the manager to an engine built elsewhere instead of from config.
+
+        session_factory defaults to a plain sessionmaker on engine; pass one
+        to control how sessions bind, e.g. to a connection inside a test
+        transaction.
+        """
+        instance = cls.get_instance()
+        instance._engine = engine
+        instance._SessionFactory = session_factory or sessionmaker(bind=engine)
+        return instance
+
     @property
     def engine(self) -> Engine:
         if self._engine is None:
@@ -112,6 +138,14 @@ class DatabaseManager:
             )
         return self._engine
 
+    def get_session(self) -> Session:
+        """Create a session from the configured factory; the caller closes it."""
+        if self._SessionFactory is None:
+            raise RuntimeError(
+                "DatabaseManager not initialized. Call initialize() first."
+            )
+        return self._SessionFactory()
+
     @contextmanager
     def session_scope(self):
         """Provide a transactional scope around a series of operations."""
@@ -1,3 +1,4 @@
+import os
 from typing import Dict, Any
 from dataclasses import dataclass
 from .database import PostgresPoolConfig
@@ -48,11 +49,13 @@ class Environments:
 
     @staticmethod
     def get_production_config() -> EnvironmentConfig:
-        """Production environment with conservative initial pool settings."""
+        """Production environment with the pool sized for concurrent request load."""
         return EnvironmentConfig(
             pool_config=PostgresPoolConfig(
-                pool_size=5,
-                max_overflow=5,
+                # At least two connections per CPU so in-flight queries don't
+                # queue behind each other waiting for a checkout
+                pool_size=max(20, 2 * (os.cpu_count() or 1)),
+                max_overflow=10,
                 pool_timeout=30,
                 pool_recycle=1800,
                 pool_pre_ping=True,
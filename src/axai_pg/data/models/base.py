@@ -33,17 +33,26 @@ class DualIdMixin:
         """8-character string ID for UI display, derived from last 8 chars of UUID."""
         return Column(String(8), unique=True, nullable=False, index=True)
 
+    @staticmethod
+    def short_id_for(uuid_val) -> str:
+        """Derive the 8-character short ID for a UUID (its last 8 hex digits).
+
+        Use this when inserting rows without the model constructor, e.g.
+        Core insert() or COPY, so the ids match what __init__ would assign.
+        """
+        return str(uuid_val).replace("-", "")[-8:]
+
     def __init__(self, **kwargs):
         """Initialize with auto-generated short ID from UUID if not provided."""
         # If uuid is provided but id is not, generate id from uuid
         if "uuid" in kwargs and "id" not in kwargs:
             uuid_val = kwargs["uuid"]
-            kwargs["id"] = str(uuid_val).replace("-", "")[-8:]
+            kwargs["id"] = self.short_id_for(uuid_val)
         # If neither uuid nor id provided, generate both
         elif "uuid" not in kwargs and "id" not in kwargs:
             new_uuid = uuid_lib.uuid4()
             kwargs["uuid"] = new_uuid
-            kwargs["id"] = str(new_uuid).replace("-", "")[-8:]
+            kwargs["id"] = self.short_id_for(new_uuid)
         super().__init__(**kwargs)
 
 
@@ -187,13 +187,13 @@ class Document(DualIdMixin, Base):
     summaries = relationship(
         "Summary",
         back_populates="document",
-        lazy="dynamic",
+        lazy="select",
         cascade="all, delete-orphan",
     )
     topics_rel = relationship(
         "DocumentTopic",
         back_populates="document",
-        lazy="dynamic",
+        lazy="select",
         cascade="all, delete-orphan",
     )
     graph_entity = relationship(
@@ -272,6 +272,20 @@ class Document(DualIdMixin, Base):
         Index("idx_documents_org_status", "org_uuid", "status"),
         Index("idx_documents_is_deleted", "is_deleted"),
         Index("idx_documents_version_id", "version_id"),
+        # Trigram indexes backing ILIKE '%...%' search (requires pg_trgm). Search
+        # matches title OR content, so both need one for a BitmapOr plan.
+        Index(
+            "idx_documents_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_documents_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
     )
 
     def __repr__(self):
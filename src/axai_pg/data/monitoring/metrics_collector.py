@@ -147,9 +147,11 @@ class MetricsCollector:
         """Get current metrics snapshot."""
         return {"timestamp": datetime.now(UTC).isoformat(), "metrics": self._metrics}
 
-    def cleanup_old_metrics(self):
-        """Clean up metrics older than retention period."""
-        cutoff = datetime.now(UTC) - timedelta(days=self.MAX_LOG_DAYS)
+    def cleanup_old_metrics(self, now: Optional[datetime] = None):
+        """Clean up metrics older than retention period, measured back from now."""
+        if now is None:
+            now = datetime.now(UTC)
+        cutoff = now - timedelta(days=self.MAX_LOG_DAYS)
 
         # Cleanup query metrics
         self._metrics["queries"] = {
@@ -1,8 +1,9 @@
-from typing import TypeVar, Generic, Optional, Dict, Any, List, Union
+from typing import TypeVar, Generic, Optional, Dict, Any, Iterable, List, Set, Union
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from uuid import UUID
 from ..config.database import DatabaseManager
+from .cache_manager import CacheManager
 from .metrics_utils import track_metrics
 import threading
 
@@ -111,6 +112,7 @@ class BaseRepository(Generic[T]):
                 session.add(db_entity)
                 session.commit()
                 session.refresh(db_entity)
+                self._invalidate_tags(self._cache_tags(db_entity))
                 return db_entity
         except SQLAlchemyError as e:
             # Log error
@@ -125,11 +127,15 @@ class BaseRepository(Generic[T]):
                 if not db_entity:
                     return None
 
+                # Results cached under the old values go stale too (e.g. a
+                # document moving to another owner)
+                stale_tags = self._cache_tags(db_entity)
                 for key, value in entity.items():
                     setattr(db_entity, key, value)
 
                 session.commit()
                 session.refresh(db_entity)
+                self._invalidate_tags(stale_tags | self._cache_tags(db_entity))
                 return db_entity
         except SQLAlchemyError as e:
             # Log error
@@ -143,8 +149,10 @@ class BaseRepository(Generic[T]):
                 entity = session.query(self.model_class).filter_by(uuid=uuid).first()
                 if not entity:
                     return False
+                stale_tags = self._cache_tags(entity)
                 session.delete(entity)
                 session.commit()
+                self._invalidate_tags(stale_tags)
                 return True
         except SQLAlchemyError as e:
             # Log error
@@ -163,6 +171,22 @@ class BaseRepository(Generic[T]):
             session.rollback()
             raise RuntimeError(f"Transaction error: {str(e)}") from e
 
+    def _cache_tags(self, entity: T) -> Set[str]:
+        """Cache tags of query results affected by a write to entity.
+
+        Empty by default; repositories with cached finders override this.
+        Writers collect the tags while the entity is loaded and drop them
+        with _invalidate_tags only after commit, so a concurrent read cannot
+        re-cache pre-commit rows.
+        """
+        return set()
+
+    def _invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Drop cached query results stored under any of tags."""
+        cache = CacheManager.get_instance()
+        for tag in tags:
+            cache.invalidate_tag(tag)
+
     def to_dict(self, entity: T, include_uuid: bool = False) -> Dict[str, Any]:
         """
         Serialize entity for API responses.
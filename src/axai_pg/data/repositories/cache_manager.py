@@ -1,6 +1,8 @@
-from typing import Any, Optional, Dict, Tuple
+from typing import Any, Callable, Optional, Dict, Set, Tuple
 from datetime import datetime, timedelta
+import functools
 import hashlib
+import inspect
 import json
 from sqlalchemy.orm import Query
 from ..config.database import DatabaseManager
@@ -12,6 +14,8 @@ class CacheManager:
     _instance: Optional["CacheManager"] = None
     _cache: Dict[str, Tuple[Any, datetime]] = {}
     _hit_counts: Dict[str, int] = {}
+    _tags: Dict[str, Set[str]] = {}  # tag -> cache keys
+    _key_tags: Dict[str, Set[str]] = {}  # cache key -> tags
     _default_ttl = timedelta(minutes=30)
     _max_cache_size = 1000  # Maximum number of cached items
 
@@ -52,16 +56,22 @@ class CacheManager:
 
         value, expiry = self._cache[key]
         if datetime.now() > expiry:
-            # Remove expired entry
-            del self._cache[key]
+            # Remove expired entry along with its hit count and tags
+            self.invalidate(key)
             return None
 
         # Update hit count
         self._hit_counts[key] = self._hit_counts.get(key, 0) + 1
         return value
 
-    def set(self, key: str, value: Any, ttl: Optional[timedelta] = None) -> None:
-        """Set a value in cache with expiration."""
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[timedelta] = None,
+        tags: Optional[Set[str]] = None,
+    ) -> None:
+        """Set a value in cache with expiration, optionally tagged for invalidation."""
         if ttl is None:
             ttl = self._default_ttl
 
@@ -73,12 +83,28 @@ class CacheManager:
         self._cache[key] = (value, expiry)
         self._hit_counts[key] = 0
 
+        if tags:
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            self._key_tags.setdefault(key, set()).update(tags)
+
     def invalidate(self, key: str) -> None:
         """Invalidate a specific cache entry."""
         if key in self._cache:
             del self._cache[key]
             if key in self._hit_counts:
                 del self._hit_counts[key]
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def invalidate_tag(self, tag: str) -> None:
+        """Invalidate every cache entry stored with the given tag."""
+        for key in self._tags.pop(tag, set()):
+            self.invalidate(key)
 
     def invalidate_pattern(self, pattern: str) -> None:
         """Invalidate all cache entries matching a pattern."""
@@ -90,6 +116,8 @@ class CacheManager:
         """Clear all cache entries."""
         self._cache.clear()
         self._hit_counts.clear()
+        self._tags.clear()
+        self._key_tags.clear()
 
     def get_hit_rate(self, key: str) -> float:
         """Get the hit rate for a specific cache key."""
@@ -117,10 +145,23 @@ class CacheManager:
                 self.invalidate(key)
 
 
-def cache_query(ttl: Optional[timedelta] = None):
-    """Decorator for caching query results."""
+def cache_query(
+    ttl: Optional[timedelta] = None,
+    tags: Optional[Callable[[Dict[str, Any], Any], Set[str]]] = None,
+):
+    """Decorator for caching query results.
+
+    Args:
+        ttl: Time-to-live for cached results
+        tags: Optional callable receiving the bound call arguments and the
+            result, returning the tags to store the entry under so writes
+            can drop it with CacheManager.invalidate_tag
+    """
 
     def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
         async def wrapper(*args, **kwargs):
             # Get cache manager
             cache_mgr = CacheManager.get_instance()
@@ -138,7 +179,12 @@ def cache_query(ttl: Optional[timedelta] = None):
 
             # Execute query and cache result
             result = await func(*args, **kwargs)
-            cache_mgr.set(cache_key, result, ttl)
+            entry_tags = None
+            if tags is not None:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                entry_tags = tags(bound.arguments, result)
+            cache_mgr.set(cache_key, result, ttl, tags=entry_tags)
             return result
 
         return wrapper
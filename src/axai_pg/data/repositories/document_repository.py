@@ -1,8 +1,18 @@
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, NamedTuple, Optional, Dict, Any, Set
 from datetime import timedelta
-from uuid import UUID
-from sqlalchemy import or_
-from sqlalchemy.orm import Session, joinedload
+from uuid import UUID, uuid4
+from sqlalchemy import (
+    Integer,
+    or_,
+    bindparam,
+    func,
+    insert,
+    lambda_stmt,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Session, selectinload
 from .base_repository import BaseRepository
 from .cache_manager import cache_query
 from .metrics_utils import track_metrics, with_metrics
@@ -10,6 +20,61 @@ from ..models.document import Document
 from ..models.topic import DocumentTopic
 from ..models.summary import Summary
 
+# Recursive CTE traversing graph relationships from a document, parsed once
+# at import. Typed binds keep the UUID comparison free of implicit casts so
+# the graph_relationships btree indexes stay usable.
+_RELATED_DOCS_SQL = text("""
+    WITH RECURSIVE related_docs AS (
+        -- Base case: direct relationships
+        SELECT DISTINCT d.uuid, d.title, 1 as depth
+        FROM documents d
+        JOIN graph_relationships gr ON gr.source_entity_uuid = :doc_uuid
+            AND gr.target_entity_uuid = d.uuid
+        WHERE d.uuid != :doc_uuid
+
+        UNION
+
+        -- Recursive case: traverse relationships
+        SELECT DISTINCT d.uuid, d.title, rd.depth + 1
+        FROM related_docs rd
+        JOIN graph_relationships gr ON gr.source_entity_uuid = rd.uuid
+        JOIN documents d ON gr.target_entity_uuid = d.uuid
+        WHERE d.uuid != :doc_uuid AND rd.depth < :max_depth
+    )
+    SELECT rd.uuid, rd.title, MIN(rd.depth) AS depth
+    FROM related_docs rd
+    GROUP BY rd.uuid, rd.title
+    ORDER BY depth;
+    """).bindparams(
+    bindparam("doc_uuid", type_=PGUUID(as_uuid=True)),
+    bindparam("max_depth", type_=Integer()),
+)
+
+
+class RelatedDocument(NamedTuple):
+    """Lightweight row for a document reached through graph relationships."""
+
+    uuid: UUID
+    title: str
+    depth: int
+
+
+def _document_tags(*param_names: str):
+    """Build a cache_query tags callable for finders returning documents.
+
+    Each named call argument becomes a tag (org_uuid -> "org:<uuid>", etc.)
+    and every returned row (Document or RelatedDocument) adds a "doc:<uuid>"
+    tag, so a write to any listed document drops the cached result.
+    """
+    prefixes = {"org_uuid": "org", "owner_uuid": "owner", "document_uuid": "doc"}
+
+    def tags(params: Dict[str, Any], result: List[Any]) -> Set[str]:
+        found = {f"{prefixes[name]}:{params[name]}" for name in param_names}
+        found.update(f"doc:{document.uuid}" for document in result or ())
+        return found
+
+    return tags
+
 
 @with_metrics
 class DocumentRepository(BaseRepository[Document]):
@@ -17,121 +82,202 @@ class DocumentRepository(BaseRepository[Document]):
 
     model_class = Document
 
+    # Rows fetched per round-trip when streaming large result sets
+    _STREAM_BATCH_SIZE = 1000
+
+    # Sortable columns by attribute name (document_metadata, not the "metadata"
+    # column name); order_by options are validated against this
+    _ORDER_COLS = {
+        attr.key: attr.columns[0] for attr in Document.__mapper__.column_attrs
+    }
+
+    # Finder statements are built once as lambda statements so SQLAlchemy's
+    # compiled cache is keyed on the lambda code rather than re-traversing
+    # the construct on every call. Values are supplied as bound parameters.
+    _FIND_BY_ORG = lambda_stmt(
+        lambda: select(Document).where(Document.org_uuid == bindparam("org_uuid"))
+    )
+    _FIND_BY_OWNER = lambda_stmt(
+        lambda: select(Document).where(Document.owner_uuid == bindparam("owner_uuid"))
+    )
+    _FIND_BY_TOPIC = lambda_stmt(
+        lambda: select(Document)
+        .join(DocumentTopic)
+        .where(DocumentTopic.topic_uuid == bindparam("topic_uuid"))
+    )
+    _FIND_BY_STATUS = lambda_stmt(
+        lambda: select(Document)
+        .where(Document.org_uuid == bindparam("org_uuid"))
+        .where(Document.status == bindparam("status"))
+    )
+    # The search term is bound rather than interpolated so the statement is
+    # reused; the trigram indexes on title and content back both ILIKE arms
+    _SEARCH = lambda_stmt(
+        lambda: select(Document)
+        .where(Document.org_uuid == bindparam("org_uuid"))
+        .where(
+            or_(
+                Document.title.ilike(func.concat("%", bindparam("q"), "%")),
+                Document.content.ilike(func.concat("%", bindparam("q"), "%")),
+            )
+        )
+    )
+
     def __init__(self):
         super().__init__(Document)
 
-    @cache_query(ttl=timedelta(minutes=15))
+    @cache_query(ttl=timedelta(minutes=15), tags=_document_tags("org_uuid"))
     @track_metrics(Document)
     async def find_by_organization(
         self, org_uuid: UUID, options: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
         """Find documents by organization UUID."""
+        return [d async for d in self.iter_by_organization(org_uuid, options)]
+
+    async def iter_by_organization(
+        self, org_uuid: UUID, options: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Document]:
+        """Stream documents by organization UUID in batches of _STREAM_BATCH_SIZE.
+
+        The session and server-side cursor stay open between yields. Callers
+        that may stop early should wrap the iterator in contextlib.aclosing so
+        both are released as soon as iteration ends.
+
+        Examples:
+            async with aclosing(repo.iter_by_organization(org_uuid)) as docs:
+                async for document in docs:
+                    ...
+        """
+        session = self._get_session()
+        result = None
         try:
-            with self._get_session() as session:
-                query = session.query(Document).filter(Document.org_uuid == org_uuid)
-                query = self._apply_document_options(query, options)
-                return query.all()
-        except Exception as e:
-            raise RuntimeError(
-                f"Error finding documents by organization: {str(e)}"
-            ) from e
-
-    @cache_query(ttl=timedelta(minutes=15))
+            stmt = self._apply_document_options(self._FIND_BY_ORG, options)
+            result = session.execute(
+                stmt,
+                {"org_uuid": org_uuid},
+                execution_options={"yield_per": self._STREAM_BATCH_SIZE},
+            )
+            for document in result.scalars():
+                yield document
+        finally:
+            if result is not None:
+                result.close()
+            session.close()
+
+    @cache_query(ttl=timedelta(minutes=15), tags=_document_tags("owner_uuid"))
     @track_metrics(Document)
     async def find_by_owner(
         self, owner_uuid: UUID, options: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
         """Find documents by owner UUID."""
-        try:
-            with self._get_session() as session:
-                query = session.query(Document).filter(
-                    Document.owner_uuid == owner_uuid
-                )
-                query = self._apply_document_options(query, options)
-                return query.all()
-        except Exception as e:
-            raise RuntimeError(f"Error finding documents by owner: {str(e)}") from e
+        with self._get_session() as session:
+            stmt = self._apply_document_options(self._FIND_BY_OWNER, options)
+            return session.execute(stmt, {"owner_uuid": owner_uuid}).scalars().all()
 
-    @cache_query(ttl=timedelta(minutes=30))
+    @cache_query(ttl=timedelta(minutes=30), tags=_document_tags())
     @track_metrics(Document)
     async def find_by_topic(
         self, topic_uuid: UUID, options: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
         """Find documents by topic UUID."""
-        try:
-            with self._get_session() as session:
-                query = (
-                    session.query(Document)
-                    .join(DocumentTopic)
-                    .filter(DocumentTopic.topic_uuid == topic_uuid)
-                )
-                query = self._apply_document_options(query, options)
-                return query.all()
-        except Exception as e:
-            raise RuntimeError(f"Error finding documents by topic: {str(e)}") from e
+        with self._get_session() as session:
+            stmt = self._apply_document_options(self._FIND_BY_TOPIC, options)
+            return session.execute(stmt, {"topic_uuid": topic_uuid}).scalars().all()
 
-    @cache_query(ttl=timedelta(minutes=30))
+    @cache_query(ttl=timedelta(minutes=30), tags=_document_tags("document_uuid"))
+    @track_metrics(Document)
+    async def find_related_document_ids(
+        self, document_uuid: UUID, max_depth: int = 2
+    ) -> List[RelatedDocument]:
+        """Find (uuid, title, depth) rows for related documents without loading ORM objects."""
+        with self._get_session() as session:
+            return self._find_related_rows(session, document_uuid, max_depth)
+
+    @cache_query(ttl=timedelta(minutes=30), tags=_document_tags("document_uuid"))
     @track_metrics(Document)
     async def find_related_documents(
         self, document_uuid: UUID, max_depth: int = 2
     ) -> List[Document]:
         """Find related documents using graph relationships up to max_depth."""
-        try:
-            with self._get_session() as session:
-                # This uses a recursive CTE query to traverse the graph
-                query = """
-                WITH RECURSIVE related_docs AS (
-                    -- Base case: direct relationships
-                    SELECT DISTINCT d.uuid, d.title, 1 as depth
-                    FROM documents d
-                    JOIN graph_relationships gr ON gr.source_entity_uuid = :doc_uuid
-                        AND gr.target_entity_uuid = d.uuid
-                    WHERE d.uuid != :doc_uuid
-
-                    UNION
-
-                    -- Recursive case: traverse relationships
-                    SELECT DISTINCT d.uuid, d.title, rd.depth + 1
-                    FROM related_docs rd
-                    JOIN graph_relationships gr ON gr.source_entity_uuid = rd.uuid
-                    JOIN documents d ON gr.target_entity_uuid = d.uuid
-                    WHERE d.uuid != :doc_uuid AND rd.depth < :max_depth
-                )
-                SELECT DISTINCT d.*
-                FROM documents d
-                JOIN related_docs rd ON rd.uuid = d.uuid
-                ORDER BY rd.depth;
-                """
-                result = session.execute(
-                    query, {"doc_uuid": document_uuid, "max_depth": max_depth}
+        with self._get_session() as session:
+            rows = self._find_related_rows(session, document_uuid, max_depth)
+            if not rows:
+                return []
+            # Load full documents in one IN (...) query, keeping depth order
+            documents = session.execute(
+                select(Document).where(Document.uuid.in_([row.uuid for row in rows]))
+            ).scalars()
+            by_uuid = {document.uuid: document for document in documents}
+            return [by_uuid[row.uuid] for row in rows if row.uuid in by_uuid]
+
+    @track_metrics(Document)
+    async def bulk_create(self, rows: List[Dict[str, Any]]) -> List[UUID]:
+        """Create many documents with batched multi-row INSERTs.
+
+        Rows go through SQLAlchemy's insertmanyvalues path, which sends
+        INSERT ... VALUES (...), (...) pages of up to 1000 rows instead of
+        one round-trip per document. Every row must provide the same fields
+        (ValueError otherwise). Returns the UUIDs of the new documents.
+        """
+        if not rows:
+            return []
+
+        records = []
+        for row in rows:
+            # Copy so the caller's dicts can be reused as templates
+            record = dict(row)
+            # Core INSERT bypasses DualIdMixin.__init__, so derive ids here
+            record.setdefault("uuid", uuid4())
+            record.setdefault("id", Document.short_id_for(record["uuid"]))
+            records.append(record)
+
+        # One executemany INSERT is compiled from the first row's keys, so
+        # rows supplying different fields would be silently misapplied
+        keys = records[0].keys()
+        for record in records[1:]:
+            if record.keys() != keys:
+                raise ValueError(
+                    "bulk_create rows must all provide the same fields; got "
+                    f"{sorted(keys)} and {sorted(record.keys())}"
                 )
-                return [Document(**row) for row in result]
-        except Exception as e:
-            raise RuntimeError(f"Error finding related documents: {str(e)}") from e
+
+        with self._get_session() as session:
+            session.execute(insert(Document), records)
+            session.commit()
+
+        # New documents belong in any cached org/owner listing
+        stale_tags = set()
+        for record in records:
+            if record.get("org_uuid") is not None:
+                stale_tags.add(f"org:{record['org_uuid']}")
+            if record.get("owner_uuid") is not None:
+                stale_tags.add(f"owner:{record['owner_uuid']}")
+        self._invalidate_tags(stale_tags)
+
+        return [record["uuid"] for record in records]
 
     @track_metrics(Document)
     async def create_with_summary(
         self, document: Dict[str, Any], summary: Dict[str, Any]
     ) -> Document:
         """Create a document and its summary in a single transaction."""
+        stale_tags: Set[str] = set()
 
         async def _create_both(session: Session):
-            # Create document
-            db_document = Document(**document)
-            session.add(db_document)
-            session.flush()  # Flush to get the document UUID
-
-            # Create summary with document reference
-            summary["document_uuid"] = db_document.uuid
-            db_summary = Summary(**summary)
-            session.add(db_summary)
-
-            # Update document flag
-            db_document.has_summary = True
+            # Assign the UUID client-side so both INSERTs go out in a single
+            # flush at commit instead of flushing for the document first.
+            # Build new dicts so the caller's are left untouched.
+            fields = {"uuid": uuid4(), **document, "has_summary": True}
+            db_document = Document(**fields)
+            db_summary = Summary(**{**summary, "document_uuid": fields["uuid"]})
+            session.add_all([db_document, db_summary])
+            stale_tags.update(self._cache_tags(db_document))
 
             return db_document
 
-        return await self.transaction(_create_both)
+        result = await self.transaction(_create_both)
+        self._invalidate_tags(stale_tags)
+        return result
 
     @track_metrics(Document)
     async def update_with_version(
@@ -141,6 +287,7 @@ class DocumentRepository(BaseRepository[Document]):
         change_description: Optional[str] = None,
     ) -> Document:
         """Update document while creating a new version record."""
+        stale_tags: Set[str] = set()
 
         async def _update_with_version(session: Session):
             # Get current document
@@ -168,78 +315,103 @@ class DocumentRepository(BaseRepository[Document]):
             )
 
             # Update document
+            stale_tags.update(self._cache_tags(current))
             for key, value in document.items():
                 setattr(current, key, value)
             current.version += 1
             current.has_versions = True
+            stale_tags.update(self._cache_tags(current))
 
             return current
 
-        return await self.transaction(_update_with_version)
+        result = await self.transaction(_update_with_version)
+        self._invalidate_tags(stale_tags)
+        return result
 
-    @cache_query(ttl=timedelta(minutes=5))
+    @cache_query(ttl=timedelta(minutes=5), tags=_document_tags("org_uuid"))
     @track_metrics(Document)
     async def search(
         self, query: str, org_uuid: UUID, options: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
         """Search documents using full-text search capabilities."""
-        try:
-            with self._get_session() as session:
-                search_query = (
-                    session.query(Document)
-                    .filter(Document.org_uuid == org_uuid)
-                    .filter(
-                        or_(
-                            Document.title.ilike(f"%{query}%"),
-                            Document.content.ilike(f"%{query}%"),
-                        )
-                    )
-                )
-                search_query = self._apply_document_options(search_query, options)
-                return search_query.all()
-        except Exception as e:
-            raise RuntimeError(f"Error searching documents: {str(e)}") from e
+        with self._get_session() as session:
+            stmt = self._apply_document_options(self._SEARCH, options)
+            return (
+                session.execute(stmt, {"q": query, "org_uuid": org_uuid})
+                .scalars()
+                .all()
+            )
 
-    @cache_query(ttl=timedelta(minutes=15))
+    @cache_query(ttl=timedelta(minutes=15), tags=_document_tags("org_uuid"))
     @track_metrics(Document)
     async def find_by_status(
         self, status: str, org_uuid: UUID, options: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
         """Find documents by status within an organization."""
-        try:
-            with self._get_session() as session:
-                query = (
-                    session.query(Document)
-                    .filter(Document.org_uuid == org_uuid)
-                    .filter(Document.status == status)
-                )
-                query = self._apply_document_options(query, options)
-                return query.all()
-        except Exception as e:
-            raise RuntimeError(f"Error finding documents by status: {str(e)}") from e
+        with self._get_session() as session:
+            stmt = self._apply_document_options(self._FIND_BY_STATUS, options)
+            return (
+                session.execute(stmt, {"status": status, "org_uuid": org_uuid})
+                .scalars()
+                .all()
+            )
 
-    def _apply_document_options(self, query, options: Optional[Dict[str, Any]] = None):
-        """Apply document-specific query options."""
+    def _find_related_rows(
+        self, session: Session, document_uuid: UUID, max_depth: int
+    ) -> List[RelatedDocument]:
+        """Run the related-documents CTE and return its rows ordered by depth."""
+        result = session.execute(
+            _RELATED_DOCS_SQL, {"doc_uuid": document_uuid, "max_depth": max_depth}
+        )
+        return [RelatedDocument(*row) for row in result]
+
+    def _cache_tags(self, entity: Document) -> Set[str]:
+        """Tags of cached finder results covering this document, its org or owner."""
+        tags = {f"doc:{entity.uuid}"}
+        if entity.org_uuid is not None:
+            tags.add(f"org:{entity.org_uuid}")
+        if entity.owner_uuid is not None:
+            tags.add(f"owner:{entity.owner_uuid}")
+        return tags
+
+    def _apply_document_options(self, stmt, options: Optional[Dict[str, Any]] = None):
+        """Apply document-specific query options to a lambda statement.
+
+        Each option is appended with add_criteria so the cache key stays
+        stable; offset/limit values are tracked as bound parameters.
+        """
         if not options:
-            return query
+            return stmt
 
+        # selectinload issues one IN (...) query per collection instead of
+        # joining both collections into a cartesian product
         if options.get("include_summaries"):
-            query = query.options(joinedload(Document.summaries))
+            stmt = stmt.add_criteria(
+                lambda s: s.options(selectinload(Document.summaries))
+            )
 
         if options.get("include_topics"):
-            query = query.options(joinedload(Document.topics))
+            stmt = stmt.add_criteria(
+                lambda s: s.options(selectinload(Document.topics_rel))
+            )
 
         if "offset" in options:
-            query = query.offset(options["offset"])
+            offset = options["offset"]
+            stmt = stmt.add_criteria(lambda s: s.offset(offset))
 
         if "limit" in options:
-            query = query.limit(options["limit"])
+            limit = options["limit"]
+            stmt = stmt.add_criteria(lambda s: s.limit(limit))
 
         if "order_by" in options:
+            cols = []
             for field, direction in options["order_by"].items():
-                column = getattr(Document, field)
-                if direction == "DESC":
-                    column = column.desc()
-                query = query.order_by(column)
+                column = self._ORDER_COLS.get(field)
+                if column is None:
+                    raise ValueError(
+                        f"Cannot order documents by unknown field: {field}"
+                    )
+                cols.append(column.desc() if direction == "DESC" else column)
+            stmt = stmt.add_criteria(lambda s: s.order_by(*cols))
 
-        return query
+        return stmt
@@ -1,8 +1,11 @@
 """Utilities for metrics tracking in repositories."""
 
+import contextlib
 import functools
+import inspect
 from datetime import datetime
 from typing import Callable, TypeVar, Type, Any
+from sqlalchemy.exc import SQLAlchemyError
 from ..models.document import Document
 
 T = TypeVar("T")
@@ -57,13 +60,56 @@ def track_metrics(model_class: Type[T]):
     return decorator
 
 
+def catch_db_errors(func: Callable[..., Any]):
+    """
+    Decorator converting SQLAlchemy errors into RuntimeError.
+
+    Only SQLAlchemyError is caught, so cancellation and other exceptions
+    propagate unchanged. Supports coroutines and async generators.
+
+    Args:
+        func: The repository method to wrap
+    """
+    if inspect.isasyncgenfunction(func):
+
+        @functools.wraps(func)
+        async def gen_wrapper(*args, **kwargs):
+            try:
+                # aclosing propagates an early close to the wrapped generator
+                async with contextlib.aclosing(func(*args, **kwargs)) as agen:
+                    async for item in agen:
+                        yield item
+            except SQLAlchemyError as e:
+                raise RuntimeError(f"Database error in {func.__name__}: {e}") from e
+
+        return gen_wrapper
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except SQLAlchemyError as e:
+            raise RuntimeError(f"Database error in {func.__name__}: {e}") from e
+
+    return wrapper
+
+
 def with_metrics(cls: Type[T]) -> Type[T]:
     """
     Class decorator for tracking metrics on repository operations.
 
+    Public async methods defined on the class are also wrapped with
+    catch_db_errors so database errors surface as RuntimeError.
+
     Args:
         cls: The repository class to track metrics for
     """
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("_"):
+            continue
+        if inspect.iscoroutinefunction(attr) or inspect.isasyncgenfunction(attr):
+            setattr(cls, name, catch_db_errors(attr))
+
     original_init = cls.__init__
 
     @functools.wraps(original_init)
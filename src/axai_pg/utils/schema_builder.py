@@ -3,7 +3,7 @@ Schema Builder Utility
 
 This module provides utilities for creating PostgreSQL-specific schema features
 that are not directly supported by SQLAlchemy's declarative syntax, such as:
-- Extensions (uuid-ossp, etc.)
+- Extensions (uuid-ossp, pg_trgm, etc.)
 - Custom functions and triggers
 - Table comments
 - Advanced indexes
@@ -41,9 +41,15 @@ class PostgreSQLSchemaBuilder:
         """
         logger.info("Creating PostgreSQL extensions...")
 
+        # Extensions are database-wide; pin them to public rather than the first
+        # schema on the search_path, which may be dropped independently
         with engine.connect() as conn:
             # UUID extension for UUID generation
-            conn.execute(text('CREATE EXTENSION IF NOT EXISTS "uuid-ossp"'))
+            conn.execute(
+                text('CREATE EXTENSION IF NOT EXISTS "uuid-ossp" SCHEMA public')
+            )
+            # Trigram extension for the documents title/content GIN indexes
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm SCHEMA public"))
             conn.commit()
 
         logger.info("PostgreSQL extensions created")
@@ -335,7 +341,10 @@ def register_schema_event_listeners():
     @event.listens_for(Base.metadata, "before_create")
     def receive_before_create(target, connection, **kw):
         logger.info("SQLAlchemy before_create event triggered")
-        connection.execute(text('CREATE EXTENSION IF NOT EXISTS "uuid-ossp"'))
+        connection.execute(
+            text('CREATE EXTENSION IF NOT EXISTS "uuid-ossp" SCHEMA public')
+        )
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm SCHEMA public"))
 
     # Example: Automatically create triggers after table creation
     @event.listens_for(Base.metadata, "after_create")
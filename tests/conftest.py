@@ -1,7 +1,7 @@
 import os
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, make_url, text
+from sqlalchemy.orm import Session, sessionmaker
 from dotenv import load_dotenv
 import sys
 from pathlib import Path
@@ -38,16 +38,79 @@ def pytest_configure(config):
 
 
 @pytest.fixture(scope="session")
-def test_engine(request):
-    """Create a test database engine."""
+def worker_schema():
+    """Name of this pytest-xdist worker's private schema, or None when not sharded."""
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    return f"test_{worker}" if worker else None
+
+
+def _create_worker_schema(engine, schema):
+    """Create the worker schema and the extensions the test schema relies on."""
+    with engine.begin() as conn:
+        # Extensions are database-wide; keep them in public so that every worker
+        # sees them, and serialize creation across workers
+        conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('axai_pg_tests'))"))
+        conn.execute(text('CREATE EXTENSION IF NOT EXISTS "uuid-ossp" SCHEMA public'))
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm SCHEMA public"))
+        conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+
+
+@pytest.fixture(scope="session")
+def test_engine(request, worker_schema):
+    """Create a test database engine.
+
+    Under pytest-xdist (``pytest -n 4 --integration``) each worker builds and
+    tears down the schema in its own PostgreSQL schema, so workers never see
+    each other's tables.
+    """
     # Only create a real engine if we're running integration tests
-    if request.config.getoption("--integration"):
-        engine = create_engine(TEST_DB_URL)
-        return engine
-    return None
+    if not request.config.getoption("--integration"):
+        yield None
+        return
+
+    # INSERT executemany already goes through insertmanyvalues; values_plus_batch
+    # also batches executemany UPDATE/DELETE through psycopg2's execute_batch.
+    # The flag is psycopg2-specific, so pin that driver for bare postgresql:// URLs.
+    url = make_url(TEST_DB_URL)
+    if url.drivername == "postgresql":
+        url = url.set(drivername="postgresql+psycopg2")
+    engine_options = {}
+    if worker_schema:
+        # N workers share one server, so cap each at the test environment's pool:
+        # one connection for the module transaction plus one overflow for tests
+        # that open their own Session on the engine
+        from axai_pg.data.config.environments import Environments
+
+        pool_config = Environments.get_test_config().pool_config
+        engine_options.update(
+            pool_size=pool_config.pool_size, max_overflow=pool_config.max_overflow
+        )
+        # Set search_path at connect time so that every pooled connection,
+        # including the one that creates the schema, resolves to this worker's
+        # schema; PostgreSQL skips the entry until the schema exists
+        engine_options["connect_args"] = {
+            "options": f"-csearch_path={worker_schema},public"
+        }
+    engine = create_engine(
+        url,
+        executemany_mode="values_plus_batch",
+        # One engine serves every module, so give the compiled-statement cache
+        # room beyond the default 500 entries to keep hot lookups from eviction
+        query_cache_size=1200,
+        **engine_options,
+    )
+    if worker_schema:
+        _create_worker_schema(engine, worker_schema)
+
+    yield engine
+
+    if worker_schema:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {worker_schema} CASCADE"))
+    engine.dispose()
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(scope="session")
 def init_test_db(test_engine):
     """Initialize the test database schema using PostgreSQLSchemaBuilder."""
     # Only initialize real database if we're running integration tests
@@ -66,25 +129,103 @@ def init_test_db(test_engine):
         yield
 
 
-@pytest.fixture(scope="function")
-def db_session(test_engine):
-    """Create a new database session for a test with transaction rollback."""
+@pytest.fixture(autouse=True)
+def _require_test_db(request):
+    """Build the test schema before any test not marked ``no_db``."""
+    if request.node.get_closest_marker("no_db") is None:
+        request.getfixturevalue("init_test_db")
+
+
+@pytest.fixture(scope="module")
+def db_connection(test_engine, init_test_db):
+    """Open one connection per test module inside an outer transaction.
+
+    Everything written through it, including module-scoped fixture rows, is
+    discarded by a single ROLLBACK when the module finishes.
+    """
     if not test_engine:
         pytest.skip("Database session only available in integration tests")
 
     connection = test_engine.connect()
     transaction = connection.begin()
-    SessionFactory = sessionmaker(bind=connection)
-    session = SessionFactory()
 
-    yield session
+    yield connection
 
-    session.close()
     if transaction.is_active:
         transaction.rollback()
     connection.close()
 
 
+@pytest.fixture(scope="module")
+def module_db_session(db_connection):
+    """Create a session for module-scoped fixtures on the module connection."""
+    session = Session(bind=db_connection)
+
+    yield session
+
+    session.close()
+
+
+@pytest.fixture(scope="function")
+def db_session(db_connection):
+    """Create a new database session for a test with transaction rollback."""
+    # Wrap the test in a SAVEPOINT on the module connection; the session nests
+    # its own SAVEPOINTs inside it, so even committed work is undone at teardown
+    savepoint = db_connection.begin_nested()
+    SessionFactory = sessionmaker(
+        bind=db_connection, join_transaction_mode="create_savepoint"
+    )
+    session = SessionFactory()
+
+    yield session
+
+    session.close()
+    if savepoint.is_active:
+        savepoint.rollback()
+
+
+@pytest.fixture(scope="class")
+def class_db_session(db_connection):
+    """Create a session shared by a test class, rolled back after the class."""
+    savepoint = db_connection.begin_nested()
+    session = Session(bind=db_connection)
+
+    yield session
+
+    session.close()
+    if savepoint.is_active:
+        savepoint.rollback()
+
+
+@pytest.fixture(scope="class")
+def usage_fixtures(class_db_session):
+    """Create one organization, user and document shared by a test class."""
+    from axai_pg import Organization, User, Document
+
+    # DualIdMixin assigns uuids client-side, so the whole graph can be wired
+    # up before anything is flushed
+    org = Organization(name="Test Organization")
+    user = User(username="testuser", email="test@example.com", org_uuid=org.uuid)
+
+    content = "Test document content"
+    document = Document(
+        title="Test Document",
+        content=content,
+        owner_uuid=user.uuid,
+        org_uuid=org.uuid,
+        document_type="text",
+        status="draft",
+        filename="test.txt",
+        file_path="/test/path/test.txt",
+        size=len(content),
+        content_type="text/plain",
+    )
+    class_db_session.add_all([org, user, document])
+    class_db_session.flush()
+
+    return org, user, document
+
+
 # Alias for backward compatibility with tests that use real_db_session
 @pytest.fixture(scope="function")
 def real_db_session(db_session):
@@ -57,11 +57,8 @@ class TestCRUDOperations:
         """Test creating document with summary and relationships."""
         # Create organization and user first
         org = Organization(name="Test Org")
-        db_session.add(org)
-        db_session.flush()
-
         user = User(username="testuser", email="test@example.com", org_uuid=org.uuid)
-        db_session.add(user)
+        db_session.add_all([org, user])
         db_session.flush()
 
         # Create document
@@ -109,11 +106,8 @@ class TestCRUDOperations:
         """Test creating topic and associating with document via junction table."""
         # Create organization, user, and document
         org = Organization(name="Test Org")
-        db_session.add(org)
-        db_session.flush()
-
         user = User(username="testuser", email="test@example.com", org_uuid=org.uuid)
-        db_session.add(user)
+        db_session.add_all([org, user])
         db_session.flush()
 
         content = "This is a test document content"
@@ -170,11 +164,8 @@ class TestCRUDOperations:
         """Test various query operations on models."""
         # Create test data
         org = Organization(name="Test Org")
-        db_session.add(org)
-        db_session.flush()
-
         user = User(username="testuser", email="test@example.com", org_uuid=org.uuid)
-        db_session.add(user)
+        db_session.add_all([org, user])
         db_session.flush()
 
         content = "This is a test document content"
@@ -251,11 +242,8 @@ class TestCRUDOperations:
         """Test updating document status and content."""
         # Create organization, user, and document
         org = Organization(name="Test Org")
-        db_session.add(org)
-        db_session.flush()
-
         user = User(username="testuser", email="test@example.com", org_uuid=org.uuid)
-        db_session.add(user)
+        db_session.add_all([org, user])
         db_session.flush()
 
         original_content = "Original content"
@@ -295,11 +283,8 @@ class TestCRUDOperations:
         """Test creating hierarchical collections with parent-child relationships."""
         # Create organization and user
         org = Organization(name="Test Org")
-        db_session.add(org)
-        db_session.flush()
-
         user = User(username="testuser", email="test@example.com", org_uuid=org.uuid)
-        db_session.add(user)
+        db_session.add_all([org, user])
         db_session.flush()
 
         # Create root collection
@@ -346,11 +331,8 @@ class TestCRUDOperations:
         """Test creating visibility profile linked to a file/document."""
         # Create organization, user, and document
         org = Organization(name="Test Org")
-        db_session.add(org)
-        db_session.flush()
-
         user = User(username="testuser", email="test@example.com", org_uuid=org.uuid)
-        db_session.add(user)
+        db_session.add_all([org, user])
         db_session.flush()
 
         content = "Test document content"
@@ -411,11 +393,8 @@ class TestCRUDOperations:
         """Test creating visibility profile linked to a collection."""
         # Create organization, user, and collection
         org = Organization(name="Test Org")
-        db_session.add(org)
-        db_session.flush()
-
         user = User(username="testuser", email="test@example.com", org_uuid=org.uuid)
-        db_session.add(user)
+        db_session.add_all([org, user])
         db_session.flush()
 
         collection = Collection(
@@ -466,11 +445,8 @@ class TestCRUDOperations:
         """Test soft delete functionality for collections."""
         # Create organization and user
         org = Organization(name="Test Org")
-        db_session.add(org)
-        db_session.flush()
-
         user = User(username="testuser", email="test@example.com", org_uuid=org.uuid)
-        db_session.add(user)
+        db_session.add_all([org, user])
         db_session.flush()
 
         # Create collection
@@ -517,11 +493,8 @@ class TestCRUDOperations:
         """Test updating visibility profile fields."""
         # Create organization and user
         org = Organization(name="Test Org")
-        db_session.add(org)
-        db_session.flush()
-
         user = User(username="testuser", email="test@example.com", org_uuid=org.uuid)
-        db_session.add(user)
+        db_session.add_all([org, user])
         db_session.flush()
 
         # Create visibility profile
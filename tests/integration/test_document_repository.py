@@ -0,0 +1,360 @@
+"""
+Integration tests for DocumentRepository against a real PostgreSQL database.
+
+Repository sessions are bound to the module connection and join the test's
+transaction through SAVEPOINTs, so their commits are rolled back with it.
+"""
+
+import asyncio
+from contextlib import aclosing
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from axai_pg import Document, GraphEntity, GraphRelationship, Organization, User
+from axai_pg.data.config.database import DatabaseManager
+from axai_pg.data.repositories.cache_manager import CacheManager
+from axai_pg.data.repositories.document_repository import DocumentRepository
+
+pytestmark = [pytest.mark.integration, pytest.mark.db]
+
+
+@pytest.fixture
+def document_repo(db_session, db_connection):
+    """DocumentRepository running inside the test transaction, with an empty cache."""
+    DatabaseManager.use_engine(
+        db_connection.engine,
+        sessionmaker(bind=db_connection, join_transaction_mode="create_savepoint"),
+    )
+    cache = CacheManager.get_instance()
+    cache.clear()
+
+    yield DocumentRepository()
+
+    cache.clear()
+
+
+@pytest.fixture
+def tenant(db_session):
+    """An organization with two users, flushed so repository sessions see them."""
+    org = Organization(name="Repository Test Org")
+    owner = User(
+        username="repo_owner", email="repo_owner@example.com", org_uuid=org.uuid
+    )
+    other = User(
+        username="repo_other", email="repo_other@example.com", org_uuid=org.uuid
+    )
+    db_session.add_all([org, owner, other])
+    db_session.flush()
+    return org, owner, other
+
+
+def _document_row(org, owner, i=0):
+    """Field values for a minimal valid document."""
+    return {
+        "title": f"Repository Document {i}",
+        "content": f"Repository content {i}",
+        "owner_uuid": owner.uuid,
+        "org_uuid": org.uuid,
+        "document_type": "text",
+        "status": "draft",
+        "filename": f"repo{i}.txt",
+        "file_path": f"/test/repo{i}.txt",
+        "size": 10,
+        "content_type": "text/plain",
+    }
+
+
+def test_bulk_create_inserts_rows_with_short_ids(db_session, document_repo, tenant):
+    """Test that bulk_create returns the new UUIDs and derives their short ids."""
+    org, owner, _ = tenant
+    rows = [_document_row(org, owner, i) for i in range(3)]
+
+    uuids = asyncio.run(document_repo.bulk_create(rows))
+
+    assert len(uuids) == 3
+    saved = db_session.execute(
+        select(Document.uuid, Document.id).where(Document.uuid.in_(uuids))
+    ).all()
+    assert {row.uuid for row in saved} == set(uuids)
+    for row in saved:
+        assert row.id == Document.short_id_for(row.uuid)
+    # The caller's dicts are left untouched
+    assert all("uuid" not in row for row in rows)
+
+
+def test_bulk_create_invalidates_org_and_owner_listings(
+    db_session, document_repo, tenant
+):
+    """Test that cached org/owner listings pick up bulk-inserted documents."""
+    org, owner, _ = tenant
+    assert asyncio.run(document_repo.find_by_organization(org.uuid)) == []
+    assert asyncio.run(document_repo.find_by_owner(owner.uuid)) == []
+
+    asyncio.run(
+        document_repo.bulk_create([_document_row(org, owner, i) for i in range(2)])
+    )
+
+    assert len(asyncio.run(document_repo.find_by_organization(org.uuid))) == 2
+    assert len(asyncio.run(document_repo.find_by_owner(owner.uuid))) == 2
+
+
+def test_bulk_create_rejects_mixed_fields(db_session, document_repo, tenant):
+    """Test that rows with differing fields are rejected before any INSERT."""
+    org, owner, _ = tenant
+    rows = [_document_row(org, owner, 0), _document_row(org, owner, 1)]
+    rows[1]["processing_status"] = "complete"
+
+    with pytest.raises(ValueError, match="same fields"):
+        asyncio.run(document_repo.bulk_create(rows))
+
+    count = db_session.scalar(
+        select(func.count()).select_from(Document).where(Document.org_uuid == org.uuid)
+    )
+    assert count == 0
+
+
+def test_writes_drop_stale_org_and_owner_listings(db_session, document_repo, tenant):
+    """Test that create/update/delete refresh cached org and owner listings.
+
+    Each listing is read once before every write so it is served from cache
+    unless the write invalidated it; the update also moves the document to
+    another owner, which must drop the old owner's listing as well.
+    """
+    org, owner, other = tenant
+
+    def listings():
+        return (
+            [
+                d.title
+                for d in asyncio.run(document_repo.find_by_organization(org.uuid))
+            ],
+            [d.uuid for d in asyncio.run(document_repo.find_by_owner(owner.uuid))],
+            [d.uuid for d in asyncio.run(document_repo.find_by_owner(other.uuid))],
+        )
+
+    assert listings() == ([], [], [])
+
+    created = asyncio.run(document_repo.create(_document_row(org, owner)))
+    assert listings() == (["Repository Document 0"], [created.uuid], [])
+
+    asyncio.run(
+        document_repo.update(
+            created.uuid, {"title": "Moved Document", "owner_uuid": other.uuid}
+        )
+    )
+    assert listings() == (["Moved Document"], [], [created.uuid])
+
+    assert asyncio.run(document_repo.delete(created.uuid)) is True
+    assert listings() == ([], [], [])
+
+
+@pytest.fixture
+def closed_sessions(document_repo, db_connection, monkeypatch):
+    """Record every repository session closed, with one-row stream batches."""
+    closed = []
+
+    class RecordingSession(Session):
+        def close(self):
+            closed.append(self)
+            super().close()
+
+    DatabaseManager.use_engine(
+        db_connection.engine,
+        sessionmaker(
+            bind=db_connection,
+            join_transaction_mode="create_savepoint",
+            class_=RecordingSession,
+        ),
+    )
+    # Keep the server cursor open across yields even for a handful of rows
+    monkeypatch.setattr(DocumentRepository, "_STREAM_BATCH_SIZE", 1)
+    return closed
+
+
+def test_iter_by_organization_streams_all_rows(
+    db_session, document_repo, tenant, closed_sessions
+):
+    """Test that consuming the stream fully yields every row and closes the session."""
+    org, owner, _ = tenant
+    asyncio.run(
+        document_repo.bulk_create([_document_row(org, owner, i) for i in range(3)])
+    )
+    closed_sessions.clear()
+
+    async def consume():
+        return [d.title async for d in document_repo.iter_by_organization(org.uuid)]
+
+    titles = asyncio.run(consume())
+
+    assert sorted(titles) == [f"Repository Document {i}" for i in range(3)]
+    assert len(closed_sessions) == 1
+
+
+def test_iter_by_organization_releases_session_on_early_stop(
+    db_session, document_repo, tenant, closed_sessions
+):
+    """Test that closing the stream mid-way releases its session and cursor."""
+    org, owner, _ = tenant
+    asyncio.run(
+        document_repo.bulk_create([_document_row(org, owner, i) for i in range(3)])
+    )
+    closed_sessions.clear()
+
+    async def first():
+        async with aclosing(document_repo.iter_by_organization(org.uuid)) as docs:
+            async for document in docs:
+                return document
+
+    assert asyncio.run(first()) is not None
+    assert len(closed_sessions) == 1
+    # The connection is usable again once the server cursor is closed
+    count = db_session.scalar(
+        select(func.count()).select_from(Document).where(Document.org_uuid == org.uuid)
+    )
+    assert count == 3
+
+
+def test_create_with_summary_leaves_input_dicts_untouched(
+    db_session, document_repo, tenant
+):
+    """Test that create_with_summary links the rows without mutating its inputs."""
+    org, owner, _ = tenant
+    document = _document_row(org, owner)
+    summary = {
+        "content": "Short summary",
+        "summary_type": "abstract",
+        "tool_agent": "t",
+    }
+    document_before, summary_before = dict(document), dict(summary)
+
+    created = asyncio.run(document_repo.create_with_summary(document, summary))
+
+    assert document == document_before
+    assert summary == summary_before
+    saved = db_session.get(Document, created.uuid)
+    assert saved.has_summary is True
+    assert [s.content for s in saved.summaries] == ["Short summary"]
+
+
+def test_order_by_uses_attribute_names(db_session, document_repo, tenant):
+    """Test that order_by accepts mapped attribute names, not column names."""
+    org, owner, _ = tenant
+    asyncio.run(
+        document_repo.bulk_create([_document_row(org, owner, i) for i in range(2)])
+    )
+
+    documents = asyncio.run(
+        document_repo.find_by_organization(
+            org.uuid, {"order_by": {"document_metadata": "ASC", "title": "DESC"}}
+        )
+    )
+    assert [d.title for d in documents] == [
+        "Repository Document 1",
+        "Repository Document 0",
+    ]
+
+
+@pytest.mark.parametrize("field", ["metadata", "no_such_field"])
+def test_order_by_rejects_unknown_field(db_session, document_repo, tenant, field):
+    """Test that ordering by anything but a Document attribute raises ValueError."""
+    org, _, _ = tenant
+
+    with pytest.raises(ValueError, match=f"unknown field: {field}"):
+        asyncio.run(
+            document_repo.find_by_organization(org.uuid, {"order_by": {field: "ASC"}})
+        )
+
+
+def test_search_predicate_uses_trigram_indexes(db_session):
+    """Test that both ILIKE arms of search can be answered from trigram indexes.
+
+    Sequential scans are disabled so the planner must show an index path if one
+    exists; an unindexed arm would force a seq scan of the whole table.
+    """
+    db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = "\n".join(
+        db_session.execute(
+            text(
+                "EXPLAIN SELECT uuid FROM documents "
+                "WHERE title ILIKE concat('%', :q, '%') "
+                "OR content ILIKE concat('%', :q, '%')"
+            ),
+            {"q": "quarterly"},
+        ).scalars()
+    )
+
+    assert "BitmapOr" in plan
+    assert "idx_documents_title_trgm" in plan
+    assert "idx_documents_content_trgm" in plan
+    assert "Seq Scan" not in plan
+
+
+def _link_documents(db_session, *documents):
+    """Chain documents with graph relationships: first -> second -> ...
+
+    The related-documents CTE follows relationships between graph entities
+    that share their document's UUID.
+    """
+    db_session.add_all(
+        GraphEntity(
+            uuid=document.uuid,
+            entity_id=str(document.uuid),
+            entity_type="document",
+            name=document.title,
+            created_by_tool="test",
+        )
+        for document in documents
+    )
+    db_session.add_all(
+        GraphRelationship(
+            source_entity_uuid=source.uuid,
+            target_entity_uuid=target.uuid,
+            relationship_type="references",
+            created_by_tool="test",
+        )
+        for source, target in zip(documents, documents[1:])
+    )
+    db_session.flush()
+
+
+def test_find_related_document_ids_follows_links(db_session, document_repo, tenant):
+    """Test that related rows are found by depth, up to max_depth."""
+    org, owner, _ = tenant
+    uuids = asyncio.run(
+        document_repo.bulk_create([_document_row(org, owner, i) for i in range(4)])
+    )
+    first, second, third, unlinked = (db_session.get(Document, u) for u in uuids)
+    _link_documents(db_session, first, second, third)
+
+    related = asyncio.run(document_repo.find_related_document_ids(first.uuid))
+    assert related == [
+        (second.uuid, second.title, 1),
+        (third.uuid, third.title, 2),
+    ]
+    assert unlinked.uuid not in {row.uuid for row in related}
+
+    direct = asyncio.run(
+        document_repo.find_related_document_ids(first.uuid, max_depth=1)
+    )
+    assert direct == [(second.uuid, second.title, 1)]
+
+
+def test_find_related_document_ids_drops_stale_related_rows(
+    db_session, document_repo, tenant
+):
+    """Test that updating a related document refreshes the cached rows."""
+    org, owner, _ = tenant
+    uuids = asyncio.run(
+        document_repo.bulk_create([_document_row(org, owner, i) for i in range(2)])
+    )
+    first, second = (db_session.get(Document, u) for u in uuids)
+    _link_documents(db_session, first, second)
+    related = asyncio.run(document_repo.find_related_document_ids(first.uuid))
+    assert [row.title for row in related] == ["Repository Document 1"]
+
+    asyncio.run(document_repo.update(second.uuid, {"title": "Renamed Document"}))
+
+    related = asyncio.run(document_repo.find_related_document_ids(first.uuid))
+    assert [row.title for row in related] == ["Renamed Document"]
@@ -96,7 +96,7 @@ class TestPostgreSQLSchemaBuilder:
         PostgreSQLSchemaBuilder.build_complete_schema(test_engine)
 
     def test_create_extensions(self, test_engine):
-        """Test that create_extensions installs uuid-ossp extension."""
+        """Test that create_extensions installs uuid-ossp in the public schema."""
         # Drop extension if exists
         with test_engine.connect() as conn:
             conn.execute(text('DROP EXTENSION IF EXISTS "uuid-ossp"'))
@@ -113,6 +113,15 @@ class TestPostgreSQLSchemaBuilder:
                 )
             )
             assert result.scalar() is True, "uuid-ossp extension should be created"
+            # Not the per-worker schema first on the search_path under xdist
+            schema = conn.execute(
+                text(
+                    "SELECT n.nspname FROM pg_extension e "
+                    "JOIN pg_namespace n ON n.oid = e.extnamespace "
+                    "WHERE e.extname = 'uuid-ossp'"
+                )
+            ).scalar()
+            assert schema == "public"
             conn.commit()
 
     def test_create_update_timestamp_trigger(self, test_engine):
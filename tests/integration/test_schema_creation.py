@@ -56,6 +56,13 @@ class TestSchemaCreation:
         )
         assert result.scalar() is True, "uuid-ossp extension should be installed"
 
+    def test_trigram_extension_exists(self, db_session):
+        """Test that the pg_trgm extension is installed."""
+        result = db_session.execute(
+            text("SELECT EXISTS(SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+        )
+        assert result.scalar() is True, "pg_trgm extension should be installed"
+
     def test_uuid_columns_exist(self, db_session):
         """Test that UUID columns are properly created."""
         inspector = inspect(db_session.bind)
@@ -185,11 +192,8 @@ class TestSchemaCreation:
         """Test that documents status check constraint works."""
         # Create required entities
         org = Organization(name="Test Org")
-        db_session.add(org)
-        db_session.flush()
-
         user = User(username="testuser", email="test@example.com", org_uuid=org.uuid)
-        db_session.add(user)
+        db_session.add_all([org, user])
         db_session.flush()
 
         # Invalid status should fail
@@ -220,11 +224,8 @@ class TestSchemaCreation:
     def test_check_constraint_documents_version(self, db_session):
         """Test that documents version check constraint works."""
         org = Organization(name="Test Org")
-        db_session.add(org)
-        db_session.flush()
-
         user = User(username="testuser", email="test@example.com", org_uuid=org.uuid)
-        db_session.add(user)
+        db_session.add_all([org, user])
         db_session.flush()
 
         # Version <= 0 should fail
@@ -265,6 +266,8 @@ class TestSchemaCreation:
             "idx_documents_owner_uuid",
             "idx_documents_type",
             "idx_documents_status",
+            "idx_documents_title_trgm",
+            "idx_documents_content_trgm",
         ]
 
         for idx_name in expected_indexes:
@@ -290,11 +293,8 @@ class TestSchemaCreation:
         """Test that cascade deletes work properly."""
         # Create organization with user and document
         org = Organization(name="Test Org")
-        db_session.add(org)
-        db_session.flush()
-
         user = User(username="testuser", email="test@example.com", org_uuid=org.uuid)
-        db_session.add(user)
+        db_session.add_all([org, user])
         db_session.flush()
 
         content = "Content"
@@ -352,11 +352,8 @@ class TestSchemaCreation:
     def test_jsonb_columns_work(self, db_session):
         """Test that JSONB columns work properly."""
         org = Organization(name="Test Org")
-        db_session.add(org)
-        db_session.flush()
-
         user = User(username="testuser", email="test@example.com", org_uuid=org.uuid)
-        db_session.add(user)
+        db_session.add_all([org, user])
         db_session.flush()
 
         # Create document with JSONB metadata
@@ -439,11 +436,8 @@ class TestSchemaCreation:
         """Test that visibility profile type check constraint works."""
         # Create dependencies
         org = Organization(name="Test Org")
-        db_session.add(org)
-        db_session.flush()
-
         user = User(username="testuser", email="test@example.com", org_uuid=org.uuid)
-        db_session.add(user)
+        db_session.add_all([org, user])
         db_session.flush()
 
         # Invalid profile_type should fail
@@ -467,11 +461,8 @@ class TestSchemaCreation:
         """Test that JSON columns work correctly for visibility profiles."""
         # Create dependencies
         org = Organization(name="Test Org")
-        db_session.add(org)
-        db_session.flush()
-
         user = User(username="testuser", email="test@example.com", org_uuid=org.uuid)
-        db_session.add(user)
+        db_session.add_all([org, user])
         db_session.flush()
 
         # Create visibility profile with JSON data
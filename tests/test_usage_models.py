@@ -8,8 +8,10 @@ with a real PostgreSQL database, including constraints, relationships, and casca
 import pytest
 import uuid
 from decimal import Decimal
+from sqlalchemy import delete, exists, insert, select
 from sqlalchemy.exc import IntegrityError
-from axai_pg import Organization, User, Document
+from sqlalchemy.orm import joinedload, selectinload
+from axai_pg import Document, User
 from axai_pg.data.models import LLMUsage, LLMModelPricing
 
 
@@ -18,37 +20,20 @@ from axai_pg.data.models import LLMUsage, LLMModelPricing
 class TestLLMUsageModel:
     """Test LLMUsage model operations."""
 
-    def _create_test_document(self, db_session):
-        """Helper to create a test organization, user, and document."""
-        org = Organization(name="Test Organization")
-        db_session.add(org)
-        db_session.flush()
-
-        user = User(username="testuser", email="test@example.com", org_uuid=org.uuid)
-        db_session.add(user)
-        db_session.flush()
+    @pytest.fixture
+    def db_session(self, class_db_session, usage_fixtures):
+        """Run each test in a SAVEPOINT on the class session."""
+        savepoint = class_db_session.begin_nested()
 
-        content = "Test document content"
-        document = Document(
-            title="Test Document",
-            content=content,
-            owner_uuid=user.uuid,
-            org_uuid=org.uuid,
-            document_type="text",
-            status="draft",
-            filename="test.txt",
-            file_path="/test/path/test.txt",
-            size=len(content),
-            content_type="text/plain",
-        )
-        db_session.add(document)
-        db_session.flush()
+        yield class_db_session
 
-        return org, user, document
+        if savepoint.is_active:
+            savepoint.rollback()
+        class_db_session.expire_all()
 
-    def test_create_llm_usage_with_valid_data(self, db_session):
+    def test_create_llm_usage_with_valid_data(self, db_session, usage_fixtures):
         """Test creating LLMUsage record with valid data."""
-        org, user, document = self._create_test_document(db_session)
+        org, user, document = usage_fixtures
 
         usage = LLMUsage(
             document_uuid=document.uuid,
@@ -90,9 +75,11 @@ class TestLLMUsageModel:
         assert usage.usage_metadata == {"source": "test"}
         assert usage.created_at is not None
 
-    def test_create_llm_usage_with_all_operation_types(self, db_session):
+    def test_create_llm_usage_with_all_operation_types(
+        self, db_session, usage_fixtures
+    ):
         """Test creating LLMUsage records with all valid operation types."""
-        org, user, document = self._create_test_document(db_session)
+        org, user, document = usage_fixtures
 
         valid_operation_types = [
             "summary",
@@ -102,8 +89,8 @@ class TestLLMUsageModel:
             "other",
         ]
 
-        for op_type in valid_operation_types:
-            usage = LLMUsage(
+        usages = [
+            LLMUsage(
                 document_uuid=document.uuid,
                 user_uuid=user.uuid,
                 org_uuid=org.uuid,
@@ -113,87 +100,53 @@ class TestLLMUsageModel:
                 output_tokens=50,
                 total_tokens=150,
             )
-            db_session.add(usage)
-            db_session.flush()
-            assert usage.operation_type == op_type
-
-    def test_llm_usage_constraint_invalid_operation_type(self, db_session):
-        """Test that invalid operation_type is rejected by check constraint."""
-        org, user, document = self._create_test_document(db_session)
-
-        usage = LLMUsage(
-            document_uuid=document.uuid,
-            user_uuid=user.uuid,
-            org_uuid=org.uuid,
-            operation_type="invalid_operation",
-            model_name="gpt-4o",
-            input_tokens=100,
-            output_tokens=50,
-            total_tokens=150,
-        )
-        db_session.add(usage)
-
-        with pytest.raises(IntegrityError) as exc_info:
-            db_session.flush()
-        assert "llm_usage_valid_operation_type" in str(exc_info.value)
-
-    def test_llm_usage_constraint_negative_input_tokens(self, db_session):
-        """Test that negative input_tokens is rejected by check constraint."""
-        org, user, document = self._create_test_document(db_session)
-
-        usage = LLMUsage(
-            document_uuid=document.uuid,
-            operation_type="summary",
-            model_name="gpt-4o",
-            input_tokens=-1,
-            output_tokens=50,
-            total_tokens=49,
-        )
-        db_session.add(usage)
-
-        with pytest.raises(IntegrityError) as exc_info:
-            db_session.flush()
-        assert "llm_usage_input_tokens_non_negative" in str(exc_info.value)
-
-    def test_llm_usage_constraint_negative_output_tokens(self, db_session):
-        """Test that negative output_tokens is rejected by check constraint."""
-        org, user, document = self._create_test_document(db_session)
-
-        usage = LLMUsage(
-            document_uuid=document.uuid,
-            operation_type="summary",
-            model_name="gpt-4o",
-            input_tokens=100,
-            output_tokens=-1,
-            total_tokens=99,
-        )
-        db_session.add(usage)
-
-        with pytest.raises(IntegrityError) as exc_info:
-            db_session.flush()
-        assert "llm_usage_output_tokens_non_negative" in str(exc_info.value)
-
-    def test_llm_usage_constraint_negative_total_tokens(self, db_session):
-        """Test that negative total_tokens is rejected by check constraint."""
-        org, user, document = self._create_test_document(db_session)
-
-        usage = LLMUsage(
-            document_uuid=document.uuid,
-            operation_type="summary",
-            model_name="gpt-4o",
-            input_tokens=100,
-            output_tokens=50,
-            total_tokens=-1,
-        )
-        db_session.add(usage)
+            for op_type in valid_operation_types
+        ]
+        db_session.bulk_save_objects(usages)
+        db_session.flush()
 
+        stored = db_session.scalars(
+            select(LLMUsage.operation_type).where(
+                LLMUsage.document_uuid == document.uuid
+            )
+        ).all()
+        assert sorted(stored) == sorted(valid_operation_types)
+
+    @pytest.mark.parametrize(
+        "field,value,constraint",
+        [
+            ("operation_type", "invalid_operation", "llm_usage_valid_operation_type"),
+            ("input_tokens", -1, "llm_usage_input_tokens_non_negative"),
+            ("output_tokens", -1, "llm_usage_output_tokens_non_negative"),
+            ("total_tokens", -1, "llm_usage_total_tokens_non_negative"),
+        ],
+    )
+    def test_llm_usage_check_constraint(
+        self, db_session, usage_fixtures, field, value, constraint
+    ):
+        """Test that each check constraint rejects an otherwise valid record."""
+        org, user, document = usage_fixtures
+
+        values = {
+            "document_uuid": document.uuid,
+            "operation_type": "summary",
+            "model_name": "gpt-4o",
+            "input_tokens": 100,
+            "output_tokens": 50,
+            "total_tokens": 150,
+        }
+        values[field] = value
+
+        # Only the inner SAVEPOINT aborts; the session and shared rows survive
         with pytest.raises(IntegrityError) as exc_info:
-            db_session.flush()
-        assert "llm_usage_total_tokens_non_negative" in str(exc_info.value)
+            with db_session.begin_nested():
+                db_session.add(LLMUsage(**values))
+                db_session.flush()
+        assert constraint in str(exc_info.value)
 
-    def test_llm_usage_allows_zero_tokens(self, db_session):
+    def test_llm_usage_allows_zero_tokens(self, db_session, usage_fixtures):
         """Test that zero token values are allowed."""
-        org, user, document = self._create_test_document(db_session)
+        org, user, document = usage_fixtures
 
         usage = LLMUsage(
             document_uuid=document.uuid,
@@ -210,30 +163,9 @@ class TestLLMUsageModel:
         assert usage.output_tokens == 0
         assert usage.total_tokens == 0
 
-    def test_llm_usage_relationship_to_document(self, db_session):
-        """Test relationship navigation from LLMUsage to Document."""
-        org, user, document = self._create_test_document(db_session)
-
-        usage = LLMUsage(
-            document_uuid=document.uuid,
-            user_uuid=user.uuid,
-            org_uuid=org.uuid,
-            operation_type="summary",
-            model_name="gpt-4o",
-            input_tokens=100,
-            output_tokens=50,
-            total_tokens=150,
-        )
-        db_session.add(usage)
-        db_session.flush()
-
-        # Navigate from usage to document
-        assert usage.document.uuid == document.uuid
-        assert usage.document.title == "Test Document"
-
-    def test_llm_usage_relationship_to_user(self, db_session):
-        """Test relationship navigation from LLMUsage to User."""
-        org, user, document = self._create_test_document(db_session)
+    def test_llm_usage_relationships(self, db_session, usage_fixtures):
+        """Test relationship navigation from LLMUsage to its document, user and org."""
+        org, user, document = usage_fixtures
 
         usage = LLMUsage(
             document_uuid=document.uuid,
@@ -248,34 +180,28 @@ class TestLLMUsageModel:
         db_session.add(usage)
         db_session.flush()
 
-        # Navigate from usage to user
-        assert usage.user.uuid == user.uuid
-        assert usage.user.username == "testuser"
-
-    def test_llm_usage_relationship_to_organization(self, db_session):
-        """Test relationship navigation from LLMUsage to Organization."""
-        org, user, document = self._create_test_document(db_session)
-
-        usage = LLMUsage(
-            document_uuid=document.uuid,
-            user_uuid=user.uuid,
-            org_uuid=org.uuid,
-            operation_type="summary",
-            model_name="gpt-4o",
-            input_tokens=100,
-            output_tokens=50,
-            total_tokens=150,
+        # Load all three relationships with the usage row in one query
+        loaded = (
+            db_session.query(LLMUsage)
+            .options(
+                joinedload(LLMUsage.document),
+                joinedload(LLMUsage.user),
+                joinedload(LLMUsage.organization),
+            )
+            .filter_by(uuid=usage.uuid)
+            .one()
         )
-        db_session.add(usage)
-        db_session.flush()
 
-        # Navigate from usage to organization
-        assert usage.organization.uuid == org.uuid
-        assert usage.organization.name == "Test Organization"
+        assert loaded.document.uuid == document.uuid
+        assert loaded.document.title == "Test Document"
+        assert loaded.user.uuid == user.uuid
+        assert loaded.user.username == "testuser"
+        assert loaded.organization.uuid == org.uuid
+        assert loaded.organization.name == "Test Organization"
 
-    def test_document_llm_usage_records_relationship(self, db_session):
+    def test_document_llm_usage_records_relationship(self, db_session, usage_fixtures):
         """Test relationship navigation from Document to LLMUsage records."""
-        org, user, document = self._create_test_document(db_session)
+        org, user, document = usage_fixtures
 
         # Create multiple usage records for the same document
         usage1 = LLMUsage(
@@ -298,14 +224,16 @@ class TestLLMUsageModel:
         db_session.flush()
 
         # Navigate from document to usage records
-        usage_records = list(document.llm_usage_records)
+        usage_records = document.llm_usage_records.options(
+            selectinload(LLMUsage.user)
+        ).all()
         assert len(usage_records) == 2
         operation_types = {r.operation_type for r in usage_records}
         assert operation_types == {"summary", "graph_extraction"}
 
-    def test_user_llm_usage_records_relationship(self, db_session):
+    def test_user_llm_usage_records_relationship(self, db_session, usage_fixtures):
         """Test relationship navigation from User to LLMUsage records."""
-        org, user, document = self._create_test_document(db_session)
+        org, user, document = usage_fixtures
 
         # Create multiple usage records for the same user
         usage1 = LLMUsage(
@@ -330,14 +258,19 @@ class TestLLMUsageModel:
         db_session.flush()
 
         # Navigate from user to usage records (dynamic relationship)
-        usage_records = list(user.llm_usage_records)
+        usage_records = user.llm_usage_records.options(
+            selectinload(LLMUsage.document)
+        ).all()
         assert len(usage_records) == 2
         total_tokens = sum(r.total_tokens for r in usage_records)
         assert total_tokens == 225
+        assert {r.document.uuid for r in usage_records} == {document.uuid}
 
-    def test_cascade_delete_document_removes_usage_records(self, db_session):
+    def test_cascade_delete_document_removes_usage_records(
+        self, db_session, usage_fixtures
+    ):
         """Test that deleting a document cascades to remove associated usage records."""
-        org, user, document = self._create_test_document(db_session)
+        org, user, document = usage_fixtures
         document_uuid = document.uuid
 
         # Create usage records
@@ -360,29 +293,24 @@ class TestLLMUsageModel:
         db_session.add_all([usage1, usage2])
         db_session.flush()
 
+        usage_exists = select(exists().where(LLMUsage.document_uuid == document_uuid))
+
         # Verify usage records exist
-        usage_count = (
-            db_session.query(LLMUsage).filter_by(document_uuid=document_uuid).count()
-        )
-        assert usage_count == 2
+        assert db_session.execute(usage_exists).scalar() is True
 
-        # Delete the document
-        db_session.delete(document)
-        db_session.flush()
+        # Delete the document in the database; ON DELETE CASCADE removes usage
+        db_session.execute(delete(Document).where(Document.uuid == document_uuid))
 
         # Verify usage records were cascade deleted
-        usage_count = (
-            db_session.query(LLMUsage).filter_by(document_uuid=document_uuid).count()
-        )
-        assert usage_count == 0
+        assert db_session.execute(usage_exists).scalar() is False
 
-    def test_user_delete_sets_null_on_usage(self, db_session):
+    def test_user_delete_sets_null_on_usage(self, db_session, usage_fixtures):
         """Test that deleting a user sets user_uuid to NULL on usage records.
 
         Note: We need to use a separate user for the usage record who is NOT the document owner,
         because deleting the document owner would cascade delete the document and all usage records.
         """
-        org, doc_owner, document = self._create_test_document(db_session)
+        org, doc_owner, document = usage_fixtures
 
         # Create a second user who will be associated with the usage record
         api_user = User(username="api_user", email="api@example.com", org_uuid=org.uuid)
@@ -461,10 +389,11 @@ class TestLLMModelPricingModel:
             input_cost_per_1k=Decimal("0.006"),
             output_cost_per_1k=Decimal("0.016"),
         )
-        db_session.add(pricing2)
 
         with pytest.raises(IntegrityError):
-            db_session.flush()
+            with db_session.begin_nested():
+                db_session.add(pricing2)
+                db_session.flush()
 
     def test_llm_model_pricing_with_validity_period(self, db_session):
         """Test creating LLMModelPricing with effective_until set."""
@@ -497,25 +426,37 @@ class TestLLMModelPricingModel:
             ("gpt-3.5-turbo", "azure", "0.0005", "0.0015"),
         ]
 
+        # Core executemany skips the model constructor, so set uuid/id here
+        rows = []
         for model_name, provider, input_cost, output_cost in models:
-            pricing = LLMModelPricing(
-                model_name=model_name,
-                model_provider=provider,
-                input_cost_per_1k=Decimal(input_cost),
-                output_cost_per_1k=Decimal(output_cost),
+            row_uuid = uuid.uuid4()
+            rows.append(
+                {
+                    "uuid": row_uuid,
+                    "id": LLMModelPricing.short_id_for(row_uuid),
+                    "model_name": model_name,
+                    "model_provider": provider,
+                    "input_cost_per_1k": Decimal(input_cost),
+                    "output_cost_per_1k": Decimal(output_cost),
+                }
             )
-            db_session.add(pricing)
-
-        db_session.flush()
-
-        # Verify all models were created
-        count = db_session.query(LLMModelPricing).count()
-        assert count == 4
-
-        # Query specific model
-        gpt4o = db_session.query(LLMModelPricing).filter_by(model_name="gpt-4o").first()
-        assert gpt4o is not None
-        assert gpt4o.input_cost_per_1k == Decimal("0.005")
+        db_session.execute(insert(LLMModelPricing), rows)
+
+        # Verify all models were created with their pricing in one query
+        stored = db_session.execute(
+            select(
+                LLMModelPricing.model_name,
+                LLMModelPricing.input_cost_per_1k,
+                LLMModelPricing.output_cost_per_1k,
+            ).where(LLMModelPricing.model_name.in_([m[0] for m in models]))
+        ).all()
+        expected = {
+            model_name: (Decimal(input_cost), Decimal(output_cost))
+            for model_name, _, input_cost, output_cost in models
+        }
+        assert {
+            r.model_name: (r.input_cost_per_1k, r.output_cost_per_1k) for r in stored
+        } == expected
 
     def test_llm_model_pricing_query_by_model_name(self, db_session):
         """Test querying pricing by model name."""
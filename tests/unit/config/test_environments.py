@@ -1,3 +1,4 @@
+import os
 import pytest
 from axai_pg.data.config.environments import Environments, EnvironmentConfig
 from axai_pg.data.config.database import PostgresPoolConfig
@@ -36,8 +37,9 @@ def test_production_config():
     assert isinstance(config.pool_config, PostgresPoolConfig)
 
     # Verify production-specific settings
-    assert config.pool_config.pool_size == 5
-    assert config.pool_config.max_overflow == 5
+    assert config.pool_config.pool_size >= 20
+    assert config.pool_config.pool_size >= 2 * (os.cpu_count() or 1)
+    assert config.pool_config.max_overflow == 10
     assert config.extra_settings["echo"] is False
     assert config.extra_settings["pool_reset_on_return"] == "commit"
 
@@ -15,32 +15,30 @@ from axai_pg.data.monitoring import (
     AlertManager,
     AlertSeverity,
 )
-from axai_pg.data.config.database import (
-    DatabaseManager,
-    PostgresConnectionConfig,
-    PostgresPoolConfig,
-)
+from axai_pg.data.config.database import DatabaseManager
 
 
 @pytest.fixture
-def setup_monitoring_db():
+def setup_monitoring_db(integration_db_manager):
     """Setup test database connection."""
-    config = PostgresConnectionConfig.from_env()
-    pool_config = PostgresPoolConfig(pool_size=2, max_overflow=1)
-    DatabaseManager.initialize(config, pool_config)
     return DatabaseManager.get_instance()
 
 
 @pytest.fixture
 def metrics_collector():
-    """Get metrics collector instance."""
-    return MetricsCollector.get_instance()
+    """Get metrics collector instance with metrics from earlier tests cleared."""
+    collector = MetricsCollector.get_instance()
+    collector._metrics = {"queries": {}, "errors": {}, "pool": {}, "storage": {}}
+    return collector
 
 
 @pytest.fixture
 def alert_manager():
-    """Get alert manager instance."""
-    return AlertManager.get_instance()
+    """Get alert manager instance with cooldowns and test handlers cleared."""
+    manager = AlertManager.get_instance()
+    manager._last_alerts = {}
+    manager._alert_handlers = [manager._log_alert]
+    return manager
 
 
 def test_metrics_collection(metrics_collector):
@@ -93,17 +91,28 @@ def test_query_monitoring(metrics_collector):
     assert len(metrics["metrics"]["queries"]) > 0
 
 
-def test_log_retention(metrics_collector):
-    """Test log retention and cleanup."""
-    # Add old metrics
-    old_date = (datetime.now(UTC) - timedelta(days=8)).isoformat()
-    metrics_collector._metrics["queries"][old_date] = {"duration": 0.1, "slow": False}
+@pytest.mark.parametrize(
+    "age,retained",
+    [
+        (timedelta(days=8), False),
+        (timedelta(days=7, seconds=1), False),
+        (timedelta(days=7), False),
+        (timedelta(days=6, hours=23), True),
+    ],
+)
+def test_log_retention(metrics_collector, age, retained):
+    """Test log retention and cleanup around the retention boundary."""
+    fixed_now = datetime(2024, 1, 15, 12, 0, tzinfo=UTC)
+
+    # Add a metric of the given age
+    key = (fixed_now - age).isoformat()
+    metrics_collector._metrics["queries"][key] = {"duration": 0.1, "slow": False}
 
     # Cleanup old metrics
-    metrics_collector.cleanup_old_metrics()
+    metrics_collector.cleanup_old_metrics(now=fixed_now)
 
-    # Verify old metrics were removed
-    assert old_date not in metrics_collector._metrics["queries"]
+    # Verify only metrics inside the retention period were kept
+    assert (key in metrics_collector._metrics["queries"]) == retained
 
 
 def test_alert_cooldown(alert_manager):
@@ -113,7 +113,7 @@ def test_different_environments(mock_env_vars, monkeypatch):
     monkeypatch.setenv("APP_ENV", "production")
     prod_settings = Settings.reload()
     assert prod_settings.environment == "production"
-    assert prod_settings.env_config.pool_config.pool_size == 5
+    assert prod_settings.env_config.pool_config.pool_size >= 20
 
 
 def test_debug_and_logging_flags(mock_env_vars, monkeypatch):
@@ -9,7 +9,171 @@ To run these tests:
     pytest tests/unit/ -v --integration
 """
 
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import StringIO
+
 import pytest
+from sqlalchemy import insert
+
+from axai_pg.data.config.database import DatabaseManager, PostgresConnectionConfig
+from axai_pg.data.config.environments import Environments
+from axai_pg.data.models import Document, Organization, User
 
 # Mark all tests in this directory as integration tests
 pytestmark = [pytest.mark.integration, pytest.mark.db]
+
+_BASE_DOC_DATA = {
+    "title": "Test Document",
+    "content": "Test content for document",
+    "status": "draft",
+    "document_type": "text",
+    "filename": "test_doc.txt",
+    "file_path": "/test/test_doc.txt",
+    "size": 100,
+    "content_type": "text/plain",
+}
+
+
+# Batches at least this large are loaded with COPY instead of INSERT
+COPY_THRESHOLD = 3
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_value(value) -> str:
+    """Render a value as a COPY text-format field."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, (dict, list)):
+        # JSON/JSONB columns; str() would emit a Python repr
+        value = json.dumps(value)
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def _bulk_copy(session, model, rows, columns=None):
+    """Load ``rows`` into ``model``'s table with a single COPY.
+
+    Small batches fall back to one executemany INSERT. Either path skips
+    the mapper's ``__init__``, so rows must carry client-side keys; build
+    them from model instances to have DualIdMixin assign those.
+    """
+    if not rows:
+        return
+    columns = list(columns or rows[0])
+    if len(rows) < COPY_THRESHOLD:
+        session.execute(insert(model), [{c: row[c] for c in columns} for row in rows])
+        return
+
+    # COPY only sees server defaults, so fill in scalar Python-side defaults
+    # (status, version, flags) for the columns the rows leave out
+    mapped = model.__mapper__.columns
+    defaults = {
+        key: c.default.arg
+        for key, c in mapped.items()
+        if key not in columns and c.default is not None and c.default.is_scalar
+    }
+    columns += defaults
+    rows = [{**defaults, **row} for row in rows]
+
+    # COPY goes straight to the driver, so push pending ORM rows out first
+    session.flush()
+    buf = StringIO(
+        "".join("\t".join(_copy_value(row[c]) for c in columns) + "\n" for row in rows)
+    )
+    cursor = session.connection().connection.cursor()
+    try:
+        # Rows are keyed by attribute; COPY wants the table's column names
+        # (document_metadata is stored as "metadata")
+        cursor.copy_from(
+            buf,
+            model.__table__.name,
+            sep="\t",
+            columns=[mapped[c].name for c in columns],
+        )
+    finally:
+        cursor.close()
+
+
+@lru_cache(maxsize=1)
+def _test_conn_config() -> PostgresConnectionConfig:
+    """Parse the test database connection settings from the environment once."""
+    return PostgresConnectionConfig.from_env()
+
+
+@pytest.fixture(scope="session")
+def integration_db_engine():
+    """Engine built once from the test connection and pool configuration."""
+    config = Environments.get_test_config()
+    DatabaseManager.initialize(_test_conn_config(), config.pool_config)
+    return DatabaseManager.get_instance().engine
+
+
+@pytest.fixture
+def integration_db_manager(integration_db_engine):
+    """Database manager bound to the shared test engine.
+
+    test_database.py re-initializes the singleton with other pools and an
+    unreachable host, so the test engine is put back before every test.
+    """
+    manager = DatabaseManager.get_instance()
+    if manager.engine is not integration_db_engine:
+        manager = DatabaseManager.use_engine(integration_db_engine)
+    return manager
+
+
+@pytest.fixture(scope="session")
+def thread_pool():
+    """Worker threads shared by the concurrency tests."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        yield executor
+
+
+@pytest.fixture(scope="session")
+def bulk_copy():
+    """Bulk loader for multi-row test fixtures; see ``_bulk_copy``."""
+    return _bulk_copy
+
+
+@pytest.fixture(scope="module")
+def test_tenant(module_db_session):
+    """Creates the organization and user shared by the module.
+
+    Tests run on their own session over the same connection, so the rows
+    are flushed here, together, to be visible to them.
+    """
+    org = Organization(name="Test Repo Org")
+    user = User(
+        username="test_repo_user", email="test_repo@example.com", org_uuid=org.uuid
+    )
+    module_db_session.add_all([org, user])
+    module_db_session.flush()
+    return org, user
+
+
+@pytest.fixture(scope="module")
+def test_org(test_tenant):
+    """The module's test organization."""
+    return test_tenant[0]
+
+
+@pytest.fixture(scope="module")
+def test_user(test_tenant):
+    """The module's test user."""
+    return test_tenant[1]
+
+
+@pytest.fixture
+def sample_document_data(test_user, test_org):
+    """Provides sample document data."""
+    return {**_BASE_DOC_DATA, "owner_uuid": test_user.uuid, "org_uuid": test_org.uuid}
+
+
+@pytest.fixture
+def test_document(db_session, sample_document_data):
+    """Creates a test document."""
+    doc = Document(**sample_document_data)
+    db_session.add(doc)
+    db_session.flush()
+    return doc
@@ -0,0 +1,97 @@
+"""
+Tests for the repository query cache and its tag-based invalidation.
+"""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from axai_pg.data.repositories.cache_manager import CacheManager, cache_query
+
+# In-memory cache only; no engine or schema needed
+pytestmark = pytest.mark.no_db
+
+
+@pytest.fixture
+def cache():
+    """Provide the cache singleton, emptied before and after the test."""
+    manager = CacheManager.get_instance()
+    manager.clear()
+    yield manager
+    manager.clear()
+
+
+def test_set_with_tags_records_both_directions(cache):
+    """Test that tagged entries are indexed by tag and by key."""
+    cache.set("k1", "v1", tags={"org:a", "owner:x"})
+
+    assert cache.get("k1") == "v1"
+    assert cache._tags == {"org:a": {"k1"}, "owner:x": {"k1"}}
+    assert cache._key_tags == {"k1": {"org:a", "owner:x"}}
+
+
+def test_invalidate_tag_drops_only_tagged_entries(cache):
+    """Test that invalidating a tag removes its entries and their other tags."""
+    cache.set("k1", "v1", tags={"org:a", "owner:x"})
+    cache.set("k2", "v2", tags={"org:a"})
+    cache.set("k3", "v3", tags={"org:b"})
+
+    cache.invalidate_tag("org:a")
+
+    assert cache.get("k1") is None
+    assert cache.get("k2") is None
+    assert cache.get("k3") == "v3"
+    assert cache._tags == {"org:b": {"k3"}}
+    assert cache._key_tags == {"k3": {"org:b"}}
+
+
+def test_invalidate_unknown_tag_is_noop(cache):
+    """Test that invalidating a tag with no entries leaves the cache intact."""
+    cache.set("k1", "v1", tags={"org:a"})
+
+    cache.invalidate_tag("org:missing")
+
+    assert cache.get("k1") == "v1"
+
+
+def test_expired_entry_clears_bookkeeping(cache):
+    """Test that reading an expired entry also drops its hit count and tags."""
+    cache.set("k1", "v1", ttl=timedelta(seconds=-1), tags={"org:a"})
+
+    assert cache.get("k1") is None
+    assert "k1" not in cache._hit_counts
+    assert cache._tags == {}
+    assert cache._key_tags == {}
+
+
+def test_cache_query_tags_callable(cache):
+    """Test that cache_query tags entries from bound arguments and the result."""
+    calls = []
+    seen = []
+
+    def tags(params, result):
+        seen.append((dict(params), result))
+        return {f"org:{params['org_uuid']}"}
+
+    class Repo:
+        @cache_query(tags=tags)
+        async def find(self, org_uuid, limit=10):
+            calls.append(org_uuid)
+            return [org_uuid] * 2
+
+    repo = Repo()
+    assert asyncio.run(repo.find("a")) == ["a", "a"]
+    assert asyncio.run(repo.find("a")) == ["a", "a"]
+    assert calls == ["a"]
+
+    # Defaults are applied before the callable sees the arguments
+    ((params, result),) = seen
+    assert params["org_uuid"] == "a"
+    assert params["limit"] == 10
+    assert result == ["a", "a"]
+
+    # Dropping the tag forces the next call back to the wrapped function
+    cache.invalidate_tag("org:a")
+    asyncio.run(repo.find("a"))
+    assert calls == ["a", "a"]
@@ -5,57 +5,13 @@ NOTE: These tests require a real PostgreSQL database.
 Run with: pytest tests/unit/repositories/test_document_repository.py -v --integration
 """
 
-import pytest
-from axai_pg.data.models import Document, Organization, User
+import uuid
+from sqlalchemy import distinct, func, select
+from sqlalchemy.orm import load_only
+from axai_pg.data.models import Document
 from axai_pg.data.models.summary import Summary
 
 
-@pytest.fixture
-def test_org(db_session):
-    """Creates a test organization."""
-    org = Organization(name="Test Repo Org")
-    db_session.add(org)
-    db_session.flush()
-    return org
-
-
-@pytest.fixture
-def test_user(db_session, test_org):
-    """Creates a test user."""
-    user = User(
-        username="test_repo_user", email="test_repo@example.com", org_uuid=test_org.uuid
-    )
-    db_session.add(user)
-    db_session.flush()
-    return user
-
-
-@pytest.fixture
-def sample_document_data(test_user, test_org):
-    """Provides sample document data."""
-    return {
-        "title": "Test Document",
-        "content": "Test content for document",
-        "owner_uuid": test_user.uuid,
-        "org_uuid": test_org.uuid,
-        "status": "draft",
-        "document_type": "text",
-        "filename": "test_doc.txt",
-        "file_path": "/test/test_doc.txt",
-        "size": 100,
-        "content_type": "text/plain",
-    }
-
-
-@pytest.fixture
-def test_document(db_session, sample_document_data):
-    """Creates a test document."""
-    doc = Document(**sample_document_data)
-    db_session.add(doc)
-    db_session.flush()
-    return doc
-
-
 def test_create_document(db_session, sample_document_data):
     """Test creating a document."""
     doc = Document(**sample_document_data)
@@ -71,7 +27,7 @@ def test_create_document(db_session, sample_document_data):
 
 def test_find_by_uuid(db_session, test_document):
     """Test finding a document by UUID."""
-    found = db_session.query(Document).filter_by(uuid=test_document.uuid).first()
+    found = db_session.get(Document, test_document.uuid)
     assert found is not None
     assert found.uuid == test_document.uuid
     assert found.title == test_document.title
@@ -87,7 +43,12 @@ def test_find_by_short_id(db_session, test_document):
 
 def test_find_by_organization(db_session, test_document, test_org):
     """Test finding documents by organization UUID."""
-    docs = db_session.query(Document).filter_by(org_uuid=test_org.uuid).all()
+    docs = (
+        db_session.query(Document)
+        .options(load_only(Document.org_uuid))
+        .filter_by(org_uuid=test_org.uuid)
+        .all()
+    )
     assert len(docs) == 1
     assert docs[0].org_uuid == test_org.uuid
 
@@ -98,24 +59,23 @@ def test_update_document(db_session, test_document):
     test_document.title = "Updated Title"
     db_session.flush()
 
-    updated = db_session.query(Document).filter_by(uuid=test_document.uuid).first()
+    updated = db_session.get(Document, test_document.uuid)
     assert updated.title == "Updated Title"
     assert updated.title != original_title
 
 
 def test_create_document_with_summary(db_session, sample_document_data):
     """Test creating a document with an associated summary."""
-    doc = Document(**sample_document_data)
-    db_session.add(doc)
-    db_session.flush()
-
+    # The document key is known up front, so both rows go out in one flush
+    doc_uuid = uuid.uuid4()
+    doc = Document(uuid=doc_uuid, **sample_document_data)
     summary = Summary(
-        document_uuid=doc.uuid,
+        document_uuid=doc_uuid,
         content="Test summary content",
         summary_type="auto",
         tool_agent="test-agent",
     )
-    db_session.add(summary)
+    db_session.add_all([doc, summary])
     db_session.flush()
 
     assert summary.uuid is not None
@@ -138,6 +98,7 @@ def test_find_by_status(db_session, test_document, test_org):
     """Test finding documents by status."""
     docs = (
         db_session.query(Document)
+        .options(load_only(Document.status))
         .filter_by(status="draft", org_uuid=test_org.uuid)
         .all()
     )
@@ -145,17 +106,13 @@ def test_find_by_status(db_session, test_document, test_org):
     assert docs[0].status == "draft"
 
 
-def test_delete_document(db_session, sample_document_data):
+def test_delete_document(db_session, test_document):
     """Test deleting a document."""
-    doc = Document(**sample_document_data)
-    db_session.add(doc)
-    db_session.flush()
-
-    doc_uuid = doc.uuid
-    db_session.delete(doc)
+    doc_uuid = test_document.uuid
+    db_session.delete(test_document)
     db_session.flush()
 
-    found = db_session.query(Document).filter_by(uuid=doc_uuid).first()
+    found = db_session.get(Document, doc_uuid)
     assert found is None
 
 
@@ -164,7 +121,7 @@ def test_document_owner_relationship(db_session, test_document, test_user):
     assert test_document.owner_uuid == test_user.uuid
 
     # Query via relationship
-    doc = db_session.query(Document).filter_by(uuid=test_document.uuid).first()
+    doc = db_session.get(Document, test_document.uuid)
     assert doc.owner.uuid == test_user.uuid
     assert doc.owner.username == test_user.username
 
@@ -174,41 +131,65 @@ def test_document_organization_relationship(db_session, test_document, test_org)
     assert test_document.org_uuid == test_org.uuid
 
     # Query via relationship
-    doc = db_session.query(Document).filter_by(uuid=test_document.uuid).first()
+    doc = db_session.get(Document, test_document.uuid)
     assert doc.organization.uuid == test_org.uuid
     assert doc.organization.name == test_org.name
 
 
-def test_multiple_documents_same_org(db_session, test_user, test_org):
+def test_multiple_documents_same_org(db_session, bulk_copy, sample_document_data):
     """Test creating multiple documents in same organization."""
-    docs = []
-    for i in range(3):
-        doc = Document(
-            title=f"Document {i}",
-            content=f"Content {i}",
-            owner_uuid=test_user.uuid,
-            org_uuid=test_org.uuid,
-            document_type="text",
-            status="draft",
-            filename=f"doc{i}.txt",
-            file_path=f"/test/doc{i}.txt",
-            size=50,
-            content_type="text/plain",
+    # Constructing the models lets DualIdMixin assign each uuid and short ID
+    docs = [
+        Document(
+            **{
+                **sample_document_data,
+                "title": f"Document {i}",
+                "content": f"Content {i}",
+                "filename": f"doc{i}.txt",
+                "file_path": f"/test/doc{i}.txt",
+            }
         )
-        db_session.add(doc)
-        docs.append(doc)
-    db_session.flush()
-
-    # All documents should be in same org
-    org_docs = db_session.query(Document).filter_by(org_uuid=test_org.uuid).all()
-    assert len(org_docs) == 3
-
-    # Each should have unique UUID and short ID
-    uuids = {d.uuid for d in org_docs}
-    short_ids = {d.id for d in org_docs}
-    assert len(uuids) == 3
-    assert len(short_ids) == 3
-
+        for i in range(3)
+    ]
+    columns = ["uuid", "id", *sample_document_data]
+    bulk_copy(db_session, Document, [{c: getattr(d, c) for c in columns} for d in docs])
+
+    # All documents should be in same org, each with a unique UUID and short ID
+    counts = db_session.execute(
+        select(
+            func.count(),
+            func.count(distinct(Document.uuid)),
+            func.count(distinct(Document.id)),
+        ).where(Document.org_uuid == sample_document_data["org_uuid"])
+    ).one()
+    assert tuple(counts) == (3, 3, 3)
+
+
+
+def test_bulk_copy_round_trips_jsonb(db_session, bulk_copy, sample_document_data):
+    """Test that COPY-loaded JSONB metadata reads back as the same structure."""
+    metadata = {"tags": ["a", "b"], "note": "tab\there", "nested": {"n": 1}}
+    docs = [
+        Document(
+            **{
+                **sample_document_data,
+                "title": f"Json Document {i}",
+                "filename": f"json{i}.txt",
+                "file_path": f"/test/json{i}.txt",
+                "document_metadata": metadata,
+            }
+        )
+        for i in range(3)
+    ]
+    columns = ["uuid", "id", "document_metadata", *sample_document_data]
+    bulk_copy(db_session, Document, [{c: getattr(d, c) for c in columns} for d in docs])
+
+    stored = db_session.scalars(
+        select(Document.document_metadata).where(
+            Document.uuid.in_([d.uuid for d in docs])
+        )
+    ).all()
+    assert stored == [metadata] * 3
 
 def test_document_version_default(db_session, sample_document_data):
     """Test document version defaults to 1."""
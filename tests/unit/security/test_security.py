@@ -6,17 +6,15 @@ Run with: pytest tests/unit/security/test_security.py -v --integration
 """
 
 import pytest
+import uuid
+from sqlalchemy import insert
 from axai_pg.data.models.security import UserRole, RolePermission, AuditLog, Role
 from axai_pg.data.models import User, Document, Organization
 
-
-@pytest.fixture
-def test_org(db_session):
-    """Creates a test organization."""
-    org = Organization(name="Test Security Org")
-    db_session.add(org)
-    db_session.flush()
-    return org
+# test_org, test_user and test_document come from tests/unit/conftest.py and
+# are already flushed. The role fixtures below only add their rows; the
+# session's autoflush writes them out before the first query or DML
+# statement that could depend on them.
 
 
 @pytest.fixture
@@ -24,23 +22,9 @@ def test_role(db_session):
     """Creates a test role."""
     role = Role(name="test_user_role", description="Test user role")
     db_session.add(role)
-    db_session.flush()
     return role
 
 
-@pytest.fixture
-def test_user(db_session, test_org):
-    """Creates a test user with basic role."""
-    user = User(
-        username="test_security_user",
-        email="test_security@example.com",
-        org_uuid=test_org.uuid,
-    )
-    db_session.add(user)
-    db_session.flush()
-    return user
-
-
 @pytest.fixture
 def test_user_role(db_session, test_user, test_role):
     """Assigns a role to the test user."""
@@ -48,30 +32,9 @@ def test_user_role(db_session, test_user, test_role):
         user_uuid=test_user.uuid, role_uuid=test_role.uuid, role_name=test_role.name
     )
     db_session.add(user_role)
-    db_session.flush()
     return user_role
 
 
-@pytest.fixture
-def test_document(db_session, test_user, test_org):
-    """Creates a test document owned by test_user."""
-    doc = Document(
-        title="Test Security Document",
-        content="Test Content",
-        owner_uuid=test_user.uuid,
-        org_uuid=test_org.uuid,
-        document_type="text",
-        status="draft",
-        filename="security_test.txt",
-        file_path="/test/security_test.txt",
-        size=100,
-        content_type="text/plain",
-    )
-    db_session.add(doc)
-    db_session.flush()
-    return doc
-
-
 def test_user_role_assignment(db_session, test_user, test_role, test_user_role):
     """Test user role assignment."""
     # Verify role was assigned
@@ -97,20 +60,20 @@ def test_role_permission_creation(db_session):
 
 def test_multiple_permissions(db_session):
     """Test creating multiple permissions for a role."""
-    perms = [
-        RolePermission(
-            role_name="multi_role", resource_name="documents", permission_type="READ"
-        ),
-        RolePermission(
-            role_name="multi_role", resource_name="documents", permission_type="CREATE"
-        ),
-        RolePermission(
-            role_name="multi_role", resource_name="documents", permission_type="UPDATE"
-        ),
-    ]
-    for perm in perms:
-        db_session.add(perm)
-    db_session.flush()
+    # Core executemany skips the model constructor, so set uuid/id here
+    perms = []
+    for permission_type in ("READ", "CREATE", "UPDATE"):
+        perm_uuid = uuid.uuid4()
+        perms.append(
+            {
+                "uuid": perm_uuid,
+                "id": RolePermission.short_id_for(perm_uuid),
+                "role_name": "multi_role",
+                "resource_name": "documents",
+                "permission_type": permission_type,
+            }
+        )
+    db_session.execute(insert(RolePermission), perms)
 
     # Query permissions
     saved_perms = (
@@ -153,39 +116,56 @@ def test_document_ownership(db_session, test_user, test_document, test_org):
 
 def test_organization_isolation(db_session, test_org, test_user, test_document):
     """Test organization data isolation."""
-    # Create another org
-    other_org = Organization(name="Other Org")
-    db_session.add(other_org)
-    db_session.flush()
-
-    # Create user in other org
-    other_user = User(
-        username="other_user", email="other@example.com", org_uuid=other_org.uuid
+    # Keys are generated client-side so each table takes a single INSERT with
+    # no RETURNING; Core insert() skips the model constructor, so set id too
+    org_uuid, user_uuid, doc_uuid = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    db_session.execute(
+        insert(Organization),
+        [
+            {
+                "uuid": org_uuid,
+                "id": Organization.short_id_for(org_uuid),
+                "name": "Other Org",
+            }
+        ],
     )
-    db_session.add(other_user)
-    db_session.flush()
-
-    # Create document in other org
-    other_doc = Document(
-        title="Other Document",
-        content="Other Content",
-        owner_uuid=other_user.uuid,
-        org_uuid=other_org.uuid,
-        document_type="text",
-        status="draft",
-        filename="other.txt",
-        file_path="/other/other.txt",
-        size=50,
-        content_type="text/plain",
+    db_session.execute(
+        insert(User),
+        [
+            {
+                "uuid": user_uuid,
+                "id": User.short_id_for(user_uuid),
+                "username": "other_user",
+                "email": "other@example.com",
+                "org_uuid": org_uuid,
+            }
+        ],
+    )
+    db_session.execute(
+        insert(Document),
+        [
+            {
+                "uuid": doc_uuid,
+                "id": Document.short_id_for(doc_uuid),
+                "title": "Other Document",
+                "content": "Other Content",
+                "owner_uuid": user_uuid,
+                "org_uuid": org_uuid,
+                "document_type": "text",
+                "status": "draft",
+                "filename": "other.txt",
+                "file_path": "/other/other.txt",
+                "size": 50,
+                "content_type": "text/plain",
+            }
+        ],
     )
-    db_session.add(other_doc)
-    db_session.flush()
 
     # Query documents by org - should be isolated
     org1_docs = db_session.query(Document).filter_by(org_uuid=test_org.uuid).all()
-    org2_docs = db_session.query(Document).filter_by(org_uuid=other_org.uuid).all()
+    org2_docs = db_session.query(Document).filter_by(org_uuid=org_uuid).all()
 
     assert len(org1_docs) == 1
     assert len(org2_docs) == 1
     assert org1_docs[0].uuid == test_document.uuid
-    assert org2_docs[0].uuid == other_doc.uuid
+    assert org2_docs[0].uuid == doc_uuid
@@ -1,3 +1,4 @@
+import pytest
 from axai_pg.data.security.security_config import (
     SecurityConfig,
     SecurityConfigFactory,
@@ -5,6 +6,9 @@ from axai_pg.data.security.security_config import (
     CacheConfig,
 )
 
+# Pure dataclass tests; no engine or schema needed
+pytestmark = pytest.mark.no_db
+
 
 def test_default_security_config():
     """Test default security configuration creation."""